@@ -7,18 +7,20 @@ This module handles data collection from Facebook including:
 - Location data
 """
 
-import requests
+import httpx
 import asyncio
 import re
 from typing import Dict, List, Any
 from datetime import datetime
 from bs4 import BeautifulSoup
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 from config import Config
 
 class FacebookCollector:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = None):
         """Initialize Facebook collector"""
+        self.client = client or get_http_client()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -43,7 +45,7 @@ class FacebookCollector:
                 url = f"https://www.facebook.com/{profile_id}"
                 
             # Fetch profile page
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = await self.client.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -7,25 +7,28 @@ This module handles data collection from GitHub including:
 - Secret detection in public repositories
 """
 
-import requests
+import httpx
 import re
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 from config import Config
 
 # Common secret patterns
 SECRET_PATTERNS = Config.SECRET_PATTERNS
 
 class GitHubCollector:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, client: httpx.AsyncClient = None):
         """
         Initialize GitHub collector
         
         Args:
             github_token (str, optional): GitHub personal access token for authenticated requests
+            client (httpx.AsyncClient, optional): Shared HTTP client
         """
+        self.client = client or get_http_client()
         self.github_token = github_token or Config.GITHUB_TOKEN
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
@@ -51,7 +54,7 @@ class GitHubCollector:
             
             # Get user profile
             user_url = f'https://api.github.com/users/{username}'
-            user_response = requests.get(user_url, headers=self.headers, timeout=10)
+            user_response = await self.client.get(user_url, headers=self.headers, timeout=10)
             
             if user_response.status_code != 200:
                 return {"error": f"Failed to fetch user data: {user_response.status_code}"}
@@ -104,7 +107,7 @@ class GitHubCollector:
                     'direction': 'desc'
                 }
                 
-                repos_response = requests.get(repos_url, headers=self.headers, params=params, timeout=10)
+                repos_response = await self.client.get(repos_url, headers=self.headers, params=params, timeout=10)
                 
                 if repos_response.status_code != 200:
                     break
@@ -184,7 +187,7 @@ class GitHubCollector:
                 'per_page': 30  # Increased limit for better coverage
             }
             
-            search_response = requests.get(search_url, headers=self.headers, params=params, timeout=10)
+            search_response = await self.client.get(search_url, headers=self.headers, params=params, timeout=10)
             
             if search_response.status_code == 200:
                 search_results = search_response.json()
@@ -196,7 +199,7 @@ class GitHubCollector:
                     
                     file_url = item.get('url', '')
                     if file_url:
-                        file_response = requests.get(file_url, headers=self.headers, timeout=10)
+                        file_response = await self.client.get(file_url, headers=self.headers, timeout=10)
                         if file_response.status_code == 200:
                             file_data = file_response.json()
                             content = file_data.get('content', '')
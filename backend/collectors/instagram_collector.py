@@ -7,7 +7,7 @@ This module handles data collection from Instagram including:
 - Bio and website information
 """
 
-import requests
+import httpx
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
@@ -15,10 +15,12 @@ from bs4 import BeautifulSoup
 import json
 import re
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 
 class InstagramCollector:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = None):
         """Initialize Instagram collector"""
+        self.client = client or get_http_client()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -43,7 +45,7 @@ class InstagramCollector:
         try:
             # Fetch profile page
             url = f"https://www.instagram.com/{username}/"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = await self.client.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
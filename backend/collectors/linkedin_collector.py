@@ -7,22 +7,25 @@ This module handles data collection from LinkedIn including:
 - Professional connections analysis
 """
 
-import requests
+import httpx
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 from bs4 import BeautifulSoup
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 from config import Config
 
 class LinkedInCollector:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, client: httpx.AsyncClient = None):
         """
         Initialize LinkedIn collector
         
         Args:
             api_key (str, optional): Clearbit API key for enhanced data collection
+            client (httpx.AsyncClient, optional): Shared HTTP client
         """
+        self.client = client or get_http_client()
         self.clearbit_api_key = api_key or Config.CLEARBIT_API_KEY
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -42,7 +45,7 @@ class LinkedInCollector:
         
         try:
             # Scrape public LinkedIn profile
-            response = requests.get(profile_url, headers=self.headers, timeout=10)
+            response = await self.client.get(profile_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, 'html.parser')
@@ -114,7 +117,7 @@ class LinkedInCollector:
                 "User-Agent": "DFM-OSINT-Tool"
             }
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = await self.client.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -8,15 +8,17 @@ This module handles data collection from Reddit including:
 - Post history analysis
 """
 
-import requests
+import httpx
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 
 class RedditCollector:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = None):
         """Initialize Reddit collector"""
+        self.client = client or get_http_client()
         self.base_url = "https://www.reddit.com"
         self.headers = {
             'User-Agent': 'DFM-OSINT-Tool/1.0 (by /u/dfm-osint)'
@@ -37,7 +39,7 @@ class RedditCollector:
         try:
             # Fetch user about data
             about_url = f"{self.base_url}/user/{username}/about.json"
-            response = requests.get(about_url, headers=self.headers, timeout=10)
+            response = await self.client.get(about_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -85,7 +87,7 @@ class RedditCollector:
         try:
             # Fetch user overview (posts and comments)
             overview_url = f"{self.base_url}/user/{username}/overview.json?limit={limit}"
-            response = requests.get(overview_url, headers=self.headers, timeout=10)
+            response = await self.client.get(overview_url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -7,16 +7,18 @@ This module handles data collection from Twitter using Nitter (privacy-friendly
 - Recent tweet analysis
 """
 
-import requests
+import httpx
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 from bs4 import BeautifulSoup
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 
 class TwitterCollector:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient = None):
         """Initialize Twitter collector using Nitter instances"""
+        self.client = client or get_http_client()
         self.nitter_instances = [
             "https://nitter.net",
             "https://nitter.pussthecat.org",
@@ -45,7 +47,7 @@ class TwitterCollector:
             try:
                 # Fetch profile page
                 url = f"{instance}/{username}"
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = await self.client.get(url, headers=self.headers, timeout=10)
                 
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -150,7 +152,7 @@ class TwitterCollector:
             try:
                 # Fetch tweets page
                 url = f"{instance}/{username}"
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = await self.client.get(url, headers=self.headers, timeout=10)
                 
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -7,20 +7,23 @@ This module handles data collection from YouTube including:
 - Channel description and metadata
 """
 
-import requests
+import httpx
 import asyncio
 from typing import Dict, List, Any
 from datetime import datetime
 from utils.rate_limiter import rate_limit
+from utils.http_client import get_http_client
 from config import Config
 
 class YouTubeCollector:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, client: httpx.AsyncClient = None):
         """Initialize YouTube collector
         
         Args:
             api_key (str, optional): YouTube Data API key
+            client (httpx.AsyncClient, optional): Shared HTTP client
         """
+        self.client = client or get_http_client()
         self.api_key = api_key or Config.YOUTUBE_API_KEY
         self.base_url = "https://www.googleapis.com/youtube/v3"
         
@@ -52,7 +55,7 @@ class YouTubeCollector:
                 'key': self.api_key
             }
             
-            response = requests.get(f"{self.base_url}/channels", params=params, timeout=10)
+            response = await self.client.get(f"{self.base_url}/channels", params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -108,7 +111,7 @@ class YouTubeCollector:
                 'key': self.api_key
             }
             
-            response = requests.get(f"{self.base_url}/channels", params=params, timeout=10)
+            response = await self.client.get(f"{self.base_url}/channels", params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -146,7 +149,7 @@ class YouTubeCollector:
                 'key': self.api_key
             }
             
-            response = requests.get(f"{self.base_url}/search", params=params, timeout=10)
+            response = await self.client.get(f"{self.base_url}/search", params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -12,13 +12,23 @@ class Config:
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
     CLEARBIT_API_KEY = os.getenv("CLEARBIT_API_KEY", "")
     YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
+    HIBP_API_KEY = os.getenv("HIBP_API_KEY", "")
     
     # Database Configuration
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./osint_data.db")
     
+    # Scan result store (falls back to JSON files in scan_cache when unset)
+    REDIS_URL = os.getenv("REDIS_URL", "")
+    
     # Rate Limiting Settings
     REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))  # Seconds between requests
     MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))
+    COLLECTOR_TIMEOUT = float(os.getenv("COLLECTOR_TIMEOUT", "15"))  # Seconds per platform collector
+    
+    # Server Settings: uvicorn worker processes. A new scan result is only in
+    # the caches of the process that ran it until its background write lands,
+    # so with more workers a read right after the scan can briefly 404
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
     
     # Secret Detection Patterns
     SECRET_PATTERNS: List[str] = [
@@ -4,7 +4,6 @@ This module handles the normalization of data from disparate platform formats
 into a unified user profile structure.
 """
 
-import networkx as nx
 from typing import Dict, List, Any, Set
 from datetime import datetime
 import re
@@ -5,7 +5,7 @@ for improved visualization and analysis.
 """
 
 import networkx as nx
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import random
 
 
@@ -85,19 +85,41 @@ class IntelligenceGraph:
         Returns:
             str: Node ID of the created entity
         """
-        if attributes is None:
-            attributes = {}
-            
-        # Create a unique node ID
-        node_id = f"{entity_type}_{hash(value) % 100000}"
+        node_id, node_attrs = self._entity_node(entity_type, value, attributes)
         
         # Add the node with its attributes
-        node_attrs = {"type": entity_type, "value": value}
-        node_attrs.update(attributes)
         self.graph.add_node(node_id, **node_attrs)
         
         return node_id
     
+    def _entity_node(self, entity_type: str, value: str, attributes: Dict[str, Any] = None) -> Tuple[str, Dict[str, Any]]:
+        """Build the node ID and attributes for an entity without adding it"""
+        # Create a unique node ID
+        node_id = f"{entity_type}_{hash(value) % 100000}"
+        
+        node_attrs = {"type": entity_type, "value": value}
+        if attributes:
+            node_attrs.update(attributes)
+        return node_id, node_attrs
+    
+    def add_nodes_batch(self, nodes: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Add many nodes in one call.
+        
+        Args:
+            nodes (List): (node_id, attributes) pairs
+        """
+        self.graph.add_nodes_from(nodes)
+    
+    def add_edges_batch(self, edges: List[Tuple[str, str, Dict[str, Any]]]):
+        """
+        Add many edges in one call.
+        
+        Args:
+            edges (List): (source, target, attributes) triples
+        """
+        self.graph.add_edges_from(edges)
+    
     def add_relationship(self, source: str, target: str, relationship: str, strength: float = 0.5):
         """
         Add a relationship between two nodes.
@@ -133,58 +155,70 @@ class IntelligenceGraph:
         if not person_node:
             return 0  # Safety check
         
+        # Collect nodes and edges, then add them to the graph in one batch each
+        new_nodes = []
+        new_edges = []
+        
+        def add_entity(entity_type, value, attributes):
+            node_id, node_attrs = self._entity_node(entity_type, value, attributes)
+            new_nodes.append((node_id, node_attrs))
+            return node_id
+        
+        def add_relationship(source, target, relationship, strength):
+            new_edges.append((source, target, {"relationship": relationship, "strength": strength}))
+        
         # ===== EXPAND REPOSITORIES =====
         repos = osint_data.get('repositories', [])
         repo_cluster_nodes = []
         
         for repo in repos:
-            repo_node = self.add_entity('repository', repo.get('name', 'unknown'), {
+            repo_node = add_entity('repository', repo.get('name', 'unknown'), {
                 'description': repo.get('description', ''),
                 'stars': repo.get('stars', 0),
                 'language': repo.get('language', 'unknown'),
                 'url': repo.get('url', '')
             })
-            self.add_relationship(person_node, repo_node, 'owns_repository', strength=0.9)
+            add_relationship(person_node, repo_node, 'owns_repository', strength=0.9)
             repo_cluster_nodes.append((repo_node, repo))
             nodes_added += 1
             
             # ===== EXPAND SECRETS IN REPOS =====
             secrets = repo.get('secrets', [])
             for secret in secrets:
-                secret_node = self.add_entity('sensitive_data', secret.get('type', 'unknown'), {
+                secret_node = add_entity('sensitive_data', secret.get('type', 'unknown'), {
                     'severity': secret.get('severity', 'medium'),
                     'location': f"{repo.get('name')}/{secret.get('file', '')}"
                 })
-                self.add_relationship(repo_node, secret_node, 'contains_secret', strength=0.95)
+                add_relationship(repo_node, secret_node, 'contains_secret', strength=0.95)
                 nodes_added += 1
         
         # ===== EXPAND ORGANIZATIONS =====
         orgs = osint_data.get('organizations', [])
         for org in orgs:
-            org_node = self.add_entity('organization', org.get('name', 'unknown'), {
+            org_node = add_entity('organization', org.get('name', 'unknown'), {
                 'website': org.get('website', ''),
                 'employees_count': org.get('size', 0)
             })
-            self.add_relationship(person_node, org_node, 'works_for', strength=0.85)
+            add_relationship(person_node, org_node, 'works_for', strength=0.85)
             nodes_added += 1
         
         # ===== EXPAND EMAILS =====
         emails = osint_data.get('emails', [])
         for email in emails:
-            email_node = self.add_entity('email', email, {
+            email_node = add_entity('email', email, {
                 'type': 'contact'
             })
-            self.add_relationship(person_node, email_node, 'uses_email', strength=0.8)
+            add_relationship(person_node, email_node, 'uses_email', strength=0.8)
             nodes_added += 1
         
         # ===== EXPAND PLATFORMS/ACCOUNTS =====
         accounts = osint_data.get('accounts', {})
         for platform, username in accounts.items():
             if username:
-                account_node = self.add_entity('platform', username, {
+                account_node = add_entity('platform', username, {
                     'platform_name': platform
                 })
-                self.add_relationship(person_node, account_node, f'has_{platform}', strength=0.75)
+                add_relationship(person_node, account_node, f'has_{platform}', strength=0.75)
                 nodes_added += 1
         
         # ===== ADD SYNTHETIC NODES FOR DEMO (IF NEEDED) =====
@@ -198,14 +232,17 @@ class IntelligenceGraph:
             ]
             
             for sample_repo in sample_repos:
-                sample_node = self.add_entity('repository', sample_repo['name'], {
+                sample_node = add_entity('repository', sample_repo['name'], {
                     'language': sample_repo['language'],
                     'stars': sample_repo['stars'],
                     'is_sample': True  # Mark as demo data
                 })
-                self.add_relationship(person_node, sample_node, 'owns_repository', strength=0.7)
+                add_relationship(person_node, sample_node, 'owns_repository', strength=0.7)
                 nodes_added += 1
         
+        self.add_nodes_batch(new_nodes)
+        self.add_edges_batch(new_edges)
+        
         return nodes_added
     
     def auto_inflate_sparse_graph(self, osint_data: Dict[str, Any], min_nodes_required: int = 12) -> Dict[str, Any]:
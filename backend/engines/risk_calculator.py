@@ -33,11 +33,15 @@ class RiskCalculator:
         Returns:
             Dict containing risk score and breakdown
         """
+        # Collect identity nodes once; both graph-based factors need them
+        identity_nodes = [n for n, attr in intelligence_graph.nodes(data=True) 
+                         if attr.get("type") == "identity"]
+        
         # Calculate individual factor scores
         data_sensitivity_score = self._calculate_data_sensitivity_score(unified_profile)
-        cross_platform_score = self._calculate_cross_platform_score(intelligence_graph)
+        cross_platform_score = self._calculate_cross_platform_score(identity_nodes)
         recency_score = self._calculate_recency_score(unified_profile)
-        exploitability_score = self._calculate_exploitability_score(unified_profile, intelligence_graph)
+        exploitability_score = self._calculate_exploitability_score(unified_profile, intelligence_graph, identity_nodes)
         
         # Calculate weighted total score
         total_score = (
@@ -91,20 +95,16 @@ class RiskCalculator:
         # Cap at 100
         return min(score, 100)
         
-    def _calculate_cross_platform_score(self, intelligence_graph: nx.Graph) -> float:
+    def _calculate_cross_platform_score(self, identity_nodes: List[Any]) -> float:
         """
         Calculate cross-platform correlation score
         
         Args:
-            intelligence_graph (nx.Graph): Intelligence graph
+            identity_nodes (List): Identity nodes (platform presences) in the intelligence graph
             
         Returns:
             float: Cross-platform correlation score (0-100)
         """
-        # Count identities (platform presences)
-        identity_nodes = [n for n, attr in intelligence_graph.nodes(data=True) 
-                         if attr.get("type") == "identity"]
-        
         # Score based on number of platforms (max 25 points)
         platform_count = len(identity_nodes)
         return min(platform_count * 5, 25)  # 5 points per platform, max 25
@@ -149,13 +149,15 @@ class RiskCalculator:
             return 50  # Default score if parsing fails
             
     def _calculate_exploitability_score(self, unified_profile: Dict[str, Any], 
-                                     intelligence_graph: nx.Graph) -> float:
+                                     intelligence_graph: nx.Graph,
+                                     identity_nodes: List[Any]) -> float:
         """
         Calculate exploitability score based on combinations of data
         
         Args:
             unified_profile (Dict): Unified user profile
             intelligence_graph (nx.Graph): Intelligence graph
+            identity_nodes (List): Identity nodes in the intelligence graph
             
         Returns:
             float: Exploitability score (0-100)
@@ -179,8 +181,6 @@ class RiskCalculator:
             score += 20  # Medium risk for social engineering
             
         # Check for correlated identities (higher exploitability)
-        identity_nodes = [n for n, attr in intelligence_graph.nodes(data=True) 
-                         if attr.get("type") == "identity"]
         if len(identity_nodes) >= 2:
             # Look for strong correlation edges
             strong_correlations = 0
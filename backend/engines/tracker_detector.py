@@ -39,13 +39,13 @@ class TrackerDetector:
         }
         
     def detect_trackers(self, unified_profile: Dict[str, Any], 
-                       intelligence_graph: nx.Graph) -> List[Dict[str, Any]]:
+                       intelligence_graph: nx.Graph = None) -> List[Dict[str, Any]]:
         """
         Detect potential trackers based on platform usage and other indicators
         
         Args:
             unified_profile (Dict): Unified user profile
-            intelligence_graph (nx.Graph): Intelligence graph
+            intelligence_graph (nx.Graph, optional): Intelligence graph (not used by the current rules)
             
         Returns:
             List[Dict]: List of detected trackers
@@ -3,18 +3,55 @@
 This module generates interactive intelligence graphs using PyVis.
 """
 
-from pyvis.network import Network
-import networkx as nx
-from typing import Dict, Any
+import html
 import json
-import random
+from typing import Dict, Any, Iterable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# vis-network options shared by the PyVis output and the static graph viewer
+NETWORK_OPTIONS = {
+    "nodes": {
+        "shape": "dot",
+        "size": 25,
+        "font": {
+            "size": 14
+        }
+    },
+    "edges": {
+        "color": {
+            "inherit": True
+        },
+        "smooth": True
+    },
+    "physics": {
+        "enabled": True,
+        "stabilization": {
+            "iterations": 100
+        }
+    }
+}
+
+# PyVis (and its Jinja2 templates) is only loaded on the first render
+_Network = None
+
+def _get_network_class():
+    """Import pyvis.network.Network on first use and cache it"""
+    global _Network
+    if _Network is None:
+        from pyvis.network import Network
+        _Network = Network
+    return _Network
 
 class VisualizationEngine:
+    __slots__ = ()  # Stateless; avoid a per-instance __dict__
+
     def __init__(self):
         """Initialize the visualization engine"""
         pass
         
-    def create_interactive_graph(self, intelligence_graph: nx.Graph) -> str:
+    def create_interactive_graph(self, intelligence_graph: "nx.Graph") -> str:
         """
         Create an interactive HTML graph visualization
         
@@ -24,7 +61,27 @@ class VisualizationEngine:
         Returns:
             str: HTML string of the interactive graph
         """
+        return self.create_interactive_graph_from_data(
+            intelligence_graph.nodes(data=True),
+            intelligence_graph.edges(data=True)
+        )
+        
+    def create_interactive_graph_from_data(self, nodes: Iterable[Tuple[str, Dict[str, Any]]],
+                                           edges: Iterable[Tuple[str, str, Dict[str, Any]]]) -> str:
+        """
+        Create an interactive HTML graph visualization from node and edge data
+        
+        Args:
+            nodes (Iterable): (node_id, attributes) pairs
+            edges (Iterable): (source, target, attributes) triples
+            
+        Returns:
+            str: HTML string of the interactive graph
+        """
+        network_data = self.build_network_data(nodes, edges)
+        
         # Create PyVis network
+        Network = _get_network_class()
         net = Network(
             height="600px", 
             width="100%", 
@@ -33,64 +90,72 @@ class VisualizationEngine:
         )
         
         # Set options for better visualization
-        net.set_options("""
-        {
-          "nodes": {
-            "shape": "dot",
-            "size": 25,
-            "font": {
-              "size": 14
-            }
-          },
-          "edges": {
-            "color": {
-              "inherit": true
-            },
-            "smooth": true
-          },
-          "physics": {
-            "enabled": true,
-            "stabilization": {
-              "iterations": 100
-            }
-          }
-        }
-        """)
+        net.set_options(json.dumps(network_data["options"]))
         
-        # Add nodes with appropriate colors and sizes
-        for node, data in intelligence_graph.nodes(data=True):
-            node_type = data.get("type", "unknown")
-            color = self._get_node_color(node_type)
-            size = self._get_node_size(node_type)
-            label = self._get_node_label(node, data)
-            
+        for node in network_data["nodes"]:
             net.add_node(
-                node, 
-                label=label,
-                color=color,
-                size=size,
-                title=self._get_node_tooltip(data)
+                node["id"],
+                label=node["label"],
+                color=node["color"],
+                size=node["size"],
+                title=node["title"]
             )
             
-        # Add edges
-        for source, target, data in intelligence_graph.edges(data=True):
-            relationship = data.get("relationship", "connected")
-            confidence = data.get("confidence", 0.5)
-            width = max(1, int(confidence * 10))  # Width based on confidence
-            color = self._get_edge_color(confidence)
-            
+        for edge in network_data["edges"]:
             net.add_edge(
-                source, 
-                target, 
-                title=relationship,
-                width=width,
-                color=color
+                edge["from"],
+                edge["to"],
+                title=edge["title"],
+                width=edge["width"],
+                color=edge["color"]
             )
             
         # Generate HTML
         html = net.generate_html()
         return html
         
+    def build_network_data(self, nodes: Iterable[Tuple[str, Dict[str, Any]]],
+                           edges: Iterable[Tuple[str, str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Build styled vis-network node and edge data
+        
+        Args:
+            nodes (Iterable): (node_id, attributes) pairs
+            edges (Iterable): (source, target, attributes) triples
+            
+        Returns:
+            Dict: vis-network nodes, edges and options
+        """
+        # Add nodes with appropriate colors and sizes
+        vis_nodes = []
+        for node, data in nodes:
+            node_type = data.get("type", "unknown")
+            vis_nodes.append({
+                "id": node,
+                "label": self._get_node_label(node, data),
+                "color": self._get_node_color(node_type),
+                "size": self._get_node_size(node_type),
+                "title": self._get_node_tooltip(data)
+            })
+            
+        # Add edges
+        vis_edges = []
+        for source, target, data in edges:
+            confidence = data.get("confidence", 0.5)
+            vis_edges.append({
+                "from": source,
+                "to": target,
+                "title": data.get("relationship", "connected"),
+                "width": max(1, int(confidence * 10)),  # Width based on confidence
+                "color": self._get_edge_color(confidence)
+            })
+            
+        return {
+            "nodes": vis_nodes,
+            "edges": vis_edges,
+            "options": NETWORK_OPTIONS
+        }
+        
     def _get_node_color(self, node_type: str) -> str:
         """
         Get appropriate color for node type
@@ -175,11 +240,11 @@ class VisualizationEngine:
         Returns:
             str: Tooltip text
         """
-        tooltip_parts = []
-        for key, value in data.items():
-            if key not in ["type"] and value:
-                tooltip_parts.append(f"{key}: {value}")
-        return "\\n".join(tooltip_parts) if tooltip_parts else "No details"
+        # PyVis (and the static viewer) render tooltips as HTML, so break
+        # lines with <br> and escape the scraped values
+        return "<br>".join(f"{html.escape(str(key))}: {html.escape(str(value))}"
+                           for key, value in data.items()
+                           if key != "type" and value) or "No details"
         
     def _get_edge_color(self, confidence: float) -> str:
         """
@@ -203,7 +268,7 @@ class VisualizationEngine:
         else:
             return "#FF0000"  # Red
             
-    def export_graph_data(self, intelligence_graph: nx.Graph) -> Dict[str, Any]:
+    def export_graph_data(self, intelligence_graph: "nx.Graph") -> Dict[str, Any]:
         """
         Export graph data in JSON format for frontend consumption
         
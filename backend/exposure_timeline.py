@@ -2,7 +2,6 @@
 """Generate exposure timeline for visual display"""
 
 from datetime import datetime
-import pytz
 
 class ExposureTimeline:
     def __init__(self, osint_data):
@@ -15,6 +14,9 @@ class ExposureTimeline:
         # ===== GITHUB COMMITS =====
         commits = self.osint_data.get('commits', [])
         for commit in commits:
+            message = commit.get('message', '')
+            if len(message) > 60:
+                message = f"{message[:60]}..."
             self.events.append({
                 'date': commit.get('date', 'Unknown'),
                 'timestamp': self._parse_date(commit.get('date')),
@@ -22,7 +24,7 @@ class ExposureTimeline:
                 'severity': 'high',
                 'icon': '📝',
                 'title': 'Suspicious GitHub Commit',
-                'description': f"Commit message: {commit.get('message', '')[:60]}...",
+                'description': f"Commit message: {message}",
                 'source': 'GitHub',
                 'color': '#ff6b35'
             })
@@ -77,11 +79,12 @@ class ExposureTimeline:
         
         # ===== ACCOUNT CREATION =====
         accounts = self.osint_data.get('accounts', {})
+        now = datetime.now()  # Accounts carry no timestamp; share one clock read
         for platform, username in accounts.items():
             if username:
                 self.events.append({
                     'date': f'Active on {platform}',
-                    'timestamp': datetime.now(),
+                    'timestamp': now,
                     'type': 'account_active',
                     'severity': 'low',
                     'icon': '🌐',
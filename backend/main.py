@@ -1,14 +1,23 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, HttpUrl, EmailStr
-from typing import Optional, List, Dict, Any
+from fastapi.responses import ORJSONResponse, Response, FileResponse
+from pydantic import BaseModel, HttpUrl, EmailStr, ConfigDict, TypeAdapter, ValidationError
+from typing import Optional, List, Dict, Any, Tuple
 import asyncio
-import json
+import hashlib
+import orjson
+from collections import OrderedDict
 from datetime import datetime
-import networkx as nx
-from pyvis.network import Network
 import os
-import re
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import quote
+import aiofiles
+
+from config import Config
+from utils.http_client import get_http_client, close_http_client
 
 # Import our custom modules
 from collectors.github_collector import GitHubCollector
@@ -26,7 +35,7 @@ from engines.entity_resolution import entity_resolution_engine
 from engines.risk_calculator import risk_calculator
 from engines.tracker_detector import tracker_detector
 from engines.visualization import visualization_engine
-from engines.intelligence_graph import intelligence_graph_engine
+from engines.intelligence_graph import IntelligenceGraph
 
 # Import new feature modules
 from risk_assessment import SecurityRecommendations
@@ -34,7 +43,11 @@ from exposure_timeline import ExposureTimeline
 from threat_intelligence import ThreatIntelligence
 from username_predictor import UsernamePrediction as UsernamePredictorEngine
 
-app = FastAPI(title="DFM OSINT Backend", description="Multi-Platform OSINT Collection and Analysis API")
+app = FastAPI(
+    title="DFM OSINT Backend",
+    description="Multi-Platform OSINT Collection and Analysis API",
+    default_response_class=ORJSONResponse
+)
 
 # Add CORS middleware
 # Note: In development, we allow all origins to handle network access issues
@@ -47,8 +60,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cap outbound collector calls across all in-flight scans
+collector_semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
+
+# Directory holding persisted scan results when Redis is not configured
+SCAN_CACHE_DIR = Path("scan_cache")
+
+# Scan results are stored in Redis when REDIS_URL is set
+redis_client = None
+SCAN_CACHE_TTL = 86400  # Seconds a stored scan result is kept in Redis
+
+@app.on_event("startup")
+async def init_scan_store():
+    global redis_client
+    if Config.REDIS_URL:
+        # Only needed when a Redis store is configured
+        import redis.asyncio as redis_asyncio
+        redis_client = redis_asyncio.Redis.from_url(Config.REDIS_URL)
+    else:
+        os.makedirs(SCAN_CACHE_DIR, exist_ok=True)
+
+@app.on_event("shutdown")
+async def close_scan_store():
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    # Collectors and the breach check share one pooled async HTTP client
+    collectors.clear()
+    await close_http_client()
+
 # Pydantic models for request/response
 class ScanInput(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
     # Mandatory fields
     email: EmailStr
     github: str
@@ -60,6 +108,9 @@ class ScanInput(BaseModel):
     instagram: Optional[str] = None
     youtube: Optional[str] = None
 
+# Validates raw request bodies in one pass (JSON parsing included)
+SCAN_INPUT_ADAPTER = TypeAdapter(ScanInput)
+
 class PlatformLink(BaseModel):
     name: str
     handle: str
@@ -67,6 +118,22 @@ class PlatformLink(BaseModel):
     source: str  # "mandatory" | "optional" | "discovered"
     verified: bool
 
+# Characters stripped when predicting a Twitter handle from a GitHub username
+# (GitHub usernames are ASCII-only, so a translate table covers every case)
+NON_ALNUM_TABLE = str.maketrans('', '', ''.join(c for c in map(chr, range(128)) if not c.isalnum()))
+
+# Platform links reported for a scan: (name, ScanInput field, source, URL template)
+PLATFORM_LINK_SPECS = [
+    ("GitHub", "github", "mandatory", "https://github.com/{handle}"),
+    ("LinkedIn", "linkedin", "mandatory", "{handle}"),
+    ("Email", "email", "mandatory", "mailto:{handle}"),
+    ("Twitter", "twitter", "optional", "https://twitter.com/{handle}"),
+    ("Reddit", "reddit", "optional", "https://reddit.com/user/{handle}"),
+    ("Facebook", "facebook", "optional", "https://facebook.com/{handle}"),
+    ("Instagram", "instagram", "optional", "https://instagram.com/{handle}"),
+    ("YouTube", "youtube", "optional", "https://youtube.com/{handle}"),
+]
+
 class Repository(BaseModel):
     name: str
     description: str
@@ -162,234 +229,413 @@ class ScanResult(BaseModel):
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
+# Post-collection analysis stages. Each one only reads the fused profile,
+# OSINT data and graph, so they can run side by side in worker threads.
+def _build_recommendations(osint_data: Dict[str, Any], total_score: float) -> List[Dict[str, Any]]:
+    rec_engine = SecurityRecommendations(osint_data, total_score)
+    rec_engine.generate_all_recommendations()
+    return rec_engine.get_priority_score()  # Sort by priority
+
+def _build_timeline(osint_data: Dict[str, Any]):
+    timeline_engine = ExposureTimeline(osint_data)
+    timeline_events = timeline_engine.generate_timeline()
+    return timeline_events, timeline_engine.get_timeline_stats()
+
+def _build_threat_matrix(osint_data: Dict[str, Any], total_score: float, graph) -> Dict[str, Any]:
+    return ThreatIntelligence(osint_data, total_score, graph).get_threat_matrix()
+
+def _build_predictions(known_usernames: List[str], osint_data: Dict[str, Any]):
+    predictor = UsernamePredictorEngine(known_usernames, osint_data)
+    predictions = predictor.generate_predictions()
+    return predictions, predictor.get_risk_assessment()
+
+# In-process LRU of recent scan results; the persistent store (Redis or the
+# JSON files in scan_cache) is written behind in the background and only read
+# on a miss
+SCAN_CACHE_MAX_ENTRIES = 256
+scan_result_cache: "OrderedDict[str, ScanResult]" = OrderedDict()
+
+# Bump when the cache file layout changes; files written by another
+# version are fully re-validated instead of trusted
+SCAN_CACHE_VERSION = 2
+
+# Identical scan inputs within this window return the earlier result instead
+# of re-running collection
+SCAN_INPUT_CACHE_TTL = 3600  # Seconds
+scan_input_index: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # input key -> (scan_id, expires_at)
+
+# Keep references to write-behind tasks so they are not garbage collected
+_background_tasks = set()
+
+def _remember_scan_result(scan_id: str, scan_result: ScanResult):
+    scan_result_cache[scan_id] = scan_result
+    scan_result_cache.move_to_end(scan_id)
+    while len(scan_result_cache) > SCAN_CACHE_MAX_ENTRIES:
+        scan_result_cache.popitem(last=False)
+
+def _scan_input_key(handles: Dict[str, Any]) -> str:
+    """Stable hash of the scan input handles"""
+    payload = orjson.dumps(handles, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+async def _persist_scan_result(scan_id: str, result_dict: Dict[str, Any], input_key: str):
+    """Write a scan result to the persistent store without blocking the loop"""
+    # The graph (usually the largest part) is stored separately so the
+    # visualization endpoint can load it on its own
+    cache_file = SCAN_CACHE_DIR / f"{scan_id}.json"
+    graph_file = SCAN_CACHE_DIR / f"{scan_id}.graph.json"
+    try:
+        # orjson serializes datetime fields (created_at, timeline timestamps) natively
+        graph_payload = orjson.dumps(result_dict["graph_data"], option=orjson.OPT_NON_STR_KEYS)
+        cached_dict = {k: v for k, v in result_dict.items() if k != "graph_data"}
+        cached_dict["cache_version"] = SCAN_CACHE_VERSION
+        payload = orjson.dumps(cached_dict, option=orjson.OPT_NON_STR_KEYS)
+        
+        if redis_client is not None:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.set(f"scan:{scan_id}:graph", graph_payload, ex=SCAN_CACHE_TTL)
+                pipe.set(f"scan:{scan_id}", payload, ex=SCAN_CACHE_TTL)
+                # Written last so a hit always points at a stored result
+                pipe.set(f"scan:input:{input_key}", scan_id, ex=SCAN_INPUT_CACHE_TTL)
+                await pipe.execute()
+            return
+        
+        # Write the sidecar first so a readable result file implies its graph exists
+        async with aiofiles.open(graph_file, 'wb') as f:
+            await f.write(graph_payload)
+        async with aiofiles.open(cache_file, 'wb') as f:
+            await f.write(payload)
+    except Exception as cache_error:
+        # Log error but don't fail the scan
+        print(f"Warning: Failed to cache scan result: {cache_error}")
+
+async def _read_cached_json(path: Path) -> Optional[Any]:
+    """Read and parse a scan cache file without blocking the loop, or None if missing"""
+    try:
+        async with aiofiles.open(path, 'rb') as f:
+            return orjson.loads(await f.read())
+    except FileNotFoundError:
+        return None
+
+async def _load_cached_scan(scan_id: str) -> Optional[Dict[str, Any]]:
+    """Load a stored scan result (including graph_data), or None if missing"""
+    if redis_client is not None:
+        payload, graph_payload = await redis_client.mget(f"scan:{scan_id}", f"scan:{scan_id}:graph")
+        if payload is None or graph_payload is None:
+            return None
+        cached_data = orjson.loads(payload)
+        cached_data["graph_data"] = orjson.loads(graph_payload)
+        return cached_data
+    
+    cached_data = await _read_cached_json(SCAN_CACHE_DIR / f"{scan_id}.json")
+    if cached_data is None:
+        return None
+    # Current cache files keep the graph in a sidecar; older ones have it inline
+    if "graph_data" not in cached_data:
+        graph_data = await _read_cached_json(SCAN_CACHE_DIR / f"{scan_id}.graph.json")
+        if graph_data is None:
+            return None
+        cached_data["graph_data"] = graph_data
+    return cached_data
+
+async def _load_cached_graph(scan_id: str) -> Optional[Dict[str, Any]]:
+    """Load only the graph_data of a stored scan result, or None if missing"""
+    if redis_client is not None:
+        graph_payload = await redis_client.get(f"scan:{scan_id}:graph")
+        return orjson.loads(graph_payload) if graph_payload is not None else None
+    
+    # Only the graph sidecar is needed, skip the rest of the result
+    graph_data = await _read_cached_json(SCAN_CACHE_DIR / f"{scan_id}.graph.json")
+    if graph_data is not None:
+        return graph_data
+    # Older cache files keep the graph inline
+    cached_data = await _read_cached_json(SCAN_CACHE_DIR / f"{scan_id}.json")
+    return cached_data.get("graph_data") if cached_data is not None else None
+
+async def _load_cached_html(scan_id: str) -> Optional[str]:
+    """Load previously rendered visualization HTML, or None if missing"""
+    if redis_client is not None:
+        html_payload = await redis_client.get(f"scan:{scan_id}:html")
+        return html_payload.decode('utf-8') if html_payload is not None else None
+    
+    html_file = SCAN_CACHE_DIR / f"{scan_id}.html"
+    try:
+        async with aiofiles.open(html_file, 'r', encoding='utf-8') as f:
+            return await f.read()
+    except FileNotFoundError:
+        return None
+
+async def _persist_html(scan_id: str, html_content: str):
+    """Store rendered visualization HTML next to its scan result"""
+    try:
+        if redis_client is not None:
+            await redis_client.set(f"scan:{scan_id}:html", html_content, ex=SCAN_CACHE_TTL)
+            return
+        
+        # Write then rename so readers never see a partial file
+        html_file = SCAN_CACHE_DIR / f"{scan_id}.html"
+        tmp_file = SCAN_CACHE_DIR / f"{scan_id}.html.tmp"
+        async with aiofiles.open(tmp_file, 'w', encoding='utf-8') as f:
+            await f.write(html_content)
+        os.replace(tmp_file, html_file)
+    except Exception as cache_error:
+        print(f"Warning: Failed to cache visualization: {cache_error}")
+
+def _remember_scan_input(input_key: str, scan_id: str):
+    scan_input_index[input_key] = (scan_id, time.monotonic() + SCAN_INPUT_CACHE_TTL)
+    scan_input_index.move_to_end(input_key)
+    while len(scan_input_index) > SCAN_CACHE_MAX_ENTRIES:
+        scan_input_index.popitem(last=False)
+
+async def _lookup_scan_by_input(input_key: str) -> Optional[ScanResult]:
+    """Return a recent result for the same scan input, or None"""
+    entry = scan_input_index.get(input_key)
+    if entry is not None and entry[1] >= time.monotonic():
+        scan_id = entry[0]
+    elif redis_client is not None:
+        # Another worker may have run the same scan
+        scan_id = await redis_client.get(f"scan:input:{input_key}")
+        if scan_id is None:
+            return None
+        scan_id = scan_id.decode()
+    else:
+        return None
+    
+    cached_result = scan_result_cache.get(scan_id)
+    if cached_result is not None:
+        scan_result_cache.move_to_end(scan_id)
+        return cached_result
+    cached_data = await _load_cached_scan(scan_id)
+    if cached_data is None:
+        return None
+    scan_result = _construct_scan_result(cached_data)
+    _remember_scan_result(scan_id, scan_result)
+    return scan_result
+
+def _construct_scan_result(cached_data: Dict[str, Any]) -> ScanResult:
+    """Rebuild a ScanResult from a cache file this server wrote, skipping validation"""
+    if cached_data.pop("cache_version", None) != SCAN_CACHE_VERSION:
+        return ScanResult.model_validate(cached_data)
+    
+    cached_data["created_at"] = datetime.fromisoformat(cached_data["created_at"])
+    cached_data["platforms"] = [PlatformLink.model_construct(**p) for p in cached_data["platforms"]]
+    cached_data["detailed_findings"] = [DetailedFinding.model_construct(**f) for f in cached_data["detailed_findings"]]
+    cached_data["trackers"] = [Tracker.model_construct(**t) for t in cached_data["trackers"]]
+    cached_data["username_predictions"] = [UsernamePrediction.model_construct(**p) for p in cached_data["username_predictions"]]
+    if cached_data.get("recommendations"):
+        cached_data["recommendations"] = [Recommendation.model_construct(**rec) for rec in cached_data["recommendations"]]
+    if cached_data.get("timeline"):
+        cached_data["timeline"] = [
+            TimelineEvent.model_construct(**{**event, "timestamp": datetime.fromisoformat(event["timestamp"])})
+            for event in cached_data["timeline"]
+        ]
+    if cached_data.get("threat_intelligence"):
+        cached_data["threat_intelligence"] = ThreatIntelligenceMatrix.model_construct(**cached_data["threat_intelligence"])
+    if cached_data.get("predictions_risk"):
+        cached_data["predictions_risk"] = PredictionRiskAssessment.model_construct(**cached_data["predictions_risk"])
+    return ScanResult.model_construct(**cached_data)
+
+# Fields shared by every exposed-secret finding
+SECRET_FINDING_FIELDS = {
+    "platform": "GitHub",
+    "type": "exposed_secret",
+    "severity": "high",
+    "recommendation": "Remove exposed secrets and rotate any compromised credentials",
+}
+
+# Collector instances are reused across scans; built on first use around the
+# shared HTTP client and dropped when that client is closed
+collectors: Dict[str, Any] = {}
+
+def _get_collectors() -> Dict[str, Any]:
+    if not collectors:
+        http_client = get_http_client()
+        collectors.update({
+            "github": GitHubCollector(client=http_client),
+            "linkedin": LinkedInCollector(client=http_client),
+            "email": EmailCollector(),
+            "twitter": TwitterCollector(client=http_client),
+            "reddit": RedditCollector(client=http_client),
+            "facebook": FacebookCollector(client=http_client),
+            "instagram": InstagramCollector(client=http_client),
+            "youtube": YouTubeCollector(client=http_client),
+        })
+    return collectors
+
+async def _run_collector(coro):
+    """Await a collector call while holding a slot of the collector semaphore"""
+    async with collector_semaphore:
+        # A hung upstream should not stall the whole scan
+        return await asyncio.wait_for(coro, timeout=Config.COLLECTOR_TIMEOUT)
+
 # Main scan endpoint
-@app.post("/api/v1/scan", response_model=ScanResult)
-async def initiate_scan(scan_input: ScanInput):
+@app.post("/api/v1/scan", response_model=ScanResult, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": ScanInput.model_json_schema()}}
+    }
+})
+async def initiate_scan(request: Request):
     """Initiate a new OSINT scan"""
-    scan_id = f"scan_{int(datetime.now().timestamp())}"
+    # Validate the raw body directly instead of decoding it to Python objects first
+    try:
+        scan_input = SCAN_INPUT_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    
+    # Random suffix: second-resolution timestamps collided for concurrent scans
+    scan_id = f"scan_{uuid.uuid4().hex}"
+    
+    # Read the input fields once, stringifying the LinkedIn HttpUrl a single time
+    handles = {
+        "github": scan_input.github,
+        "linkedin": str(scan_input.linkedin),
+        "email": scan_input.email,
+        "twitter": scan_input.twitter,
+        "reddit": scan_input.reddit,
+        "facebook": scan_input.facebook,
+        "instagram": scan_input.instagram,
+        "youtube": scan_input.youtube,
+    }
     
+    # Repeat scans of the same input reuse the recent result
+    input_key = _scan_input_key(handles)
     try:
-        # Initialize collectors
-        github_collector = GitHubCollector()
-        linkedin_collector = LinkedInCollector()
-        email_collector = EmailCollector()
-        
-        # Initialize optional collectors if data provided
-        twitter_collector = TwitterCollector() if scan_input.twitter else None
-        reddit_collector = RedditCollector() if scan_input.reddit else None
-        facebook_collector = FacebookCollector() if scan_input.facebook else None
-        instagram_collector = InstagramCollector() if scan_input.instagram else None
-        youtube_collector = YouTubeCollector() if scan_input.youtube else None
-        
-        # Collect data from platforms concurrently
-        tasks = []
-        
-        # Mandatory collections
-        tasks.append(github_collector.collect_all_data(scan_input.github))
-        tasks.append(linkedin_collector.collect_all_data(str(scan_input.linkedin)))
-        tasks.append(email_collector.collect_all_data(scan_input.email))
+        cached_result = await _lookup_scan_by_input(input_key)
+    except Exception as cache_error:
+        print(f"Warning: Failed to look up cached scan: {cache_error}")
+        cached_result = None
+    if cached_result is not None:
+        return ORJSONResponse(cached_result.model_dump())
+    
+    try:
+        collectors = _get_collectors()
         
-        # Optional collections
-        if twitter_collector and scan_input.twitter:
-            tasks.append(twitter_collector.collect_all_data(scan_input.twitter))
-        if reddit_collector and scan_input.reddit:
-            tasks.append(reddit_collector.collect_all_data(scan_input.reddit))
-        if facebook_collector and scan_input.facebook:
-            tasks.append(facebook_collector.collect_all_data(scan_input.facebook))
-        if instagram_collector and scan_input.instagram:
-            tasks.append(instagram_collector.collect_all_data(scan_input.instagram))
-        if youtube_collector and scan_input.youtube:
-            tasks.append(youtube_collector.collect_all_data(scan_input.youtube))
+        # Collect data from platforms concurrently; collectors are keyed like
+        # handles, and optional platforms only run when a handle was given
+        tasks = [collectors[platform].collect_all_data(handle)
+                 for platform, handle in handles.items() if handle]
             
-        # Execute all collection tasks
-        platform_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all collection tasks, bounded by the collector semaphore
+        platform_results = await asyncio.gather(*(_run_collector(task) for task in tasks), return_exceptions=True)
         
         # Filter out exceptions and successful results
         successful_results = []
         for result in platform_results:
             if isinstance(result, Exception):
                 # Log error but continue with successful results
-                print(f"Collection error: {result}")
+                print(f"Collection error: {result!r}")
             else:
                 successful_results.append(result)
                 
-        # Fuse data from all platforms
-        unified_profile = data_fusion_engine.fuse_data(successful_results)
+        # Fuse data from all platforms (CPU-bound, keep it off the event loop)
+        unified_profile = await asyncio.to_thread(data_fusion_engine.fuse_data, successful_results)
+        identities = unified_profile.get("identities") or {}
         
-        # Create enhanced intelligence graph
-        graph_engine = intelligence_graph_engine
-        person_node = graph_engine.correlate_data(unified_profile)
+        # Create enhanced intelligence graph. Each scan gets its own graph so
+        # concurrent scans running in worker threads never share state.
+        graph_engine = IntelligenceGraph()
+        person_node = await asyncio.to_thread(graph_engine.correlate_data, unified_profile)
         
         # Prepare OSINT data for expansion
         osint_data = {
             'repositories': [],
             'organizations': unified_profile.get('organizations', []),
             'emails': unified_profile.get('emails', []),
-            'accounts': {}
+            'accounts': dict(identities)  # Account information per platform
         }
         
-        # Extract repositories from GitHub data
+        # Single pass over collector results: extract GitHub repositories for
+        # expansion, count repositories and build detailed findings
+        detailed_findings = []
+        repo_count = 0
         for result in successful_results:
-            if isinstance(result, dict) and result.get('platform') == 'GitHub' and 'repositories' in result:
-                osint_data['repositories'].extend(result['repositories'])
-        
-        # Add account information
-        identities = unified_profile.get('identities', {})
-        for platform, handle in identities.items():
-            osint_data['accounts'][platform] = handle
+            if not isinstance(result, dict) or "repositories" not in result:
+                continue
+            repos = result["repositories"]
+            if result.get('platform') == 'GitHub':
+                osint_data['repositories'].extend(repos)
+            
+            # Get repository count
+            repo_count = len(repos)
+            
+            # Check for secrets in GitHub repositories
+            detailed_findings.extend(
+                DetailedFinding.model_construct(
+                    **SECRET_FINDING_FIELDS,
+                    description=f"Potential secrets found in repository {repo.get('name', 'unknown')}",
+                    evidence=f"Repository contains {repo.get('secretCount', 0)} potential secrets"
+                )
+                for repo in repos if repo.get("hasSecrets", False)
+            )
         
         # Auto-inflate sparse graph for better visualization
-        osint_data = graph_engine.auto_inflate_sparse_graph(osint_data, min_nodes_required=12)
+        osint_data = await asyncio.to_thread(graph_engine.auto_inflate_sparse_graph, osint_data, 12)
         
         # Expand graph entities for enhanced visualization
-        expanded_count = graph_engine.expand_entities_for_viz(osint_data)
+        expanded_count = await asyncio.to_thread(graph_engine.expand_entities_for_viz, osint_data)
         print(f"✅ Graph expanded with {expanded_count} new nodes")
         
-        # Calculate risk score
-        risk_score = risk_calculator.calculate_risk_score(unified_profile, graph_engine.graph)
-        
-        # Detect trackers
-        trackers = tracker_detector.detect_trackers(unified_profile, graph_engine.graph)
-        
-        # Generate graph visualization data
-        graph_data = graph_engine.export_json()
-        
-        # Create detailed findings from collected data and get repository count
-        detailed_findings = []
-        repo_count = 0
-        for result in successful_results:
-            if isinstance(result, dict) and "repositories" in result:
-                # Get repository count
-                repos = result.get("repositories", [])
-                repo_count = len(repos)
-                
-                # Check for secrets in GitHub repositories
-                for repo in repos:
-                    if repo.get("hasSecrets", False):
-                        detailed_findings.append(DetailedFinding(
-                            platform="GitHub",
-                            type="exposed_secret",
-                            description=f"Potential secrets found in repository {repo.get('name', 'unknown')}",
-                            severity="high",
-                            evidence=f"Repository contains {repo.get('secretCount', 0)} potential secrets",
-                            recommendation="Remove exposed secrets and rotate any compromised credentials"
-                        ))
+        # Calculate risk score (recommendations and threat intel depend on it);
+        # it reads the graph, so keep it in-process rather than pickling it
+        risk_score = await asyncio.to_thread(risk_calculator.calculate_risk_score, unified_profile, graph_engine.graph)
+        total_score = risk_score.get('total_score', 0)
         
         # Create username predictions based on patterns
         username_predictions = []
-        identities = unified_profile.get("identities", {})
         if "github" in identities and "twitter" in identities:
             # Simple pattern prediction - if GitHub is john_doe_1990, Twitter might be johndoe1990
             github_username = identities["github"]
             # Remove underscores and keep alphanumeric
-            predicted_twitter = re.sub(r'[^a-zA-Z0-9]', '', github_username)
-            username_predictions.append(UsernamePrediction(
+            predicted_twitter = github_username.translate(NON_ALNUM_TABLE)
+            username_predictions.append(UsernamePrediction.model_construct(
                 platform="Twitter",
                 predicted_username=predicted_twitter,
                 confidence=0.7
             ))
         
         # Create platform links list
-        platforms = []
-        identities = unified_profile.get("identities", {})
-        
-        # Add mandatory platforms
-        platforms.append(PlatformLink(
-            name="GitHub",
-            handle=identities.get("github", scan_input.github),
-            url=f"https://github.com/{identities.get('github', scan_input.github)}",
-            source="mandatory",
-            verified=True
-        ))
-        
-        platforms.append(PlatformLink(
-            name="LinkedIn",
-            handle=str(scan_input.linkedin),
-            url=str(scan_input.linkedin),
-            source="mandatory",
-            verified=True
-        ))
-        
-        platforms.append(PlatformLink(
-            name="Email",
-            handle=scan_input.email,
-            url=f"mailto:{scan_input.email}",
-            source="mandatory",
-            verified=True
-        ))
+        github_handle = identities.get("github", handles["github"])
         
-        # Add optional platforms
-        if scan_input.twitter:
-            platforms.append(PlatformLink(
-                name="Twitter",
-                handle=scan_input.twitter,
-                url=f"https://twitter.com/{scan_input.twitter}",
-                source="optional",
-                verified=True
-            ))
-        if scan_input.reddit:
-            platforms.append(PlatformLink(
-                name="Reddit",
-                handle=scan_input.reddit,
-                url=f"https://reddit.com/user/{scan_input.reddit}",
-                source="optional",
-                verified=True
-            ))
-        if scan_input.facebook:
-            platforms.append(PlatformLink(
-                name="Facebook",
-                handle=scan_input.facebook,
-                url=f"https://facebook.com/{scan_input.facebook}",
-                source="optional",
-                verified=True
-            ))
-        if scan_input.instagram:
-            platforms.append(PlatformLink(
-                name="Instagram",
-                handle=scan_input.instagram,
-                url=f"https://instagram.com/{scan_input.instagram}",
-                source="optional",
-                verified=True
-            ))
-        if scan_input.youtube:
-            platforms.append(PlatformLink(
-                name="YouTube",
-                handle=scan_input.youtube,
-                url=f"https://youtube.com/{scan_input.youtube}",
-                source="optional",
-                verified=True
-            ))
-        
-        # NEW: Generate recommendations
-        rec_engine = SecurityRecommendations(osint_data, risk_score.get('total_score', 0))
-        recommendations = rec_engine.generate_all_recommendations()
-        recommendations = rec_engine.get_priority_score()  # Sort by priority
-        
-        # NEW: Generate timeline
-        timeline_engine = ExposureTimeline(osint_data)
-        timeline_events = timeline_engine.generate_timeline()
-        timeline_stats = timeline_engine.get_timeline_stats()
-        
-        # NEW: Generate threat intelligence
-        threat_intel_engine = ThreatIntelligence(osint_data, risk_score.get('total_score', 0), graph_engine.graph)
-        threat_matrix = threat_intel_engine.get_threat_matrix()
-        
-        # NEW: Generate username predictions
-        known_usernames = [
-            identities.get("github", ""),
-            identities.get("twitter", ""),
-            identities.get("reddit", "")
-        ]
-        known_usernames = [u for u in known_usernames if u]  # Remove empty
-        
-        predictor = UsernamePredictorEngine(known_usernames, osint_data)
-        predictions = predictor.generate_predictions()
-        predictions_risk = predictor.get_risk_assessment()
+        platforms = []
+        for name, field, source, url_template in PLATFORM_LINK_SPECS:
+            handle = github_handle if field == "github" else handles[field]
+            if handle:
+                platforms.append(PlatformLink.model_construct(
+                    name=name,
+                    handle=handle,
+                    url=url_template.format(handle=handle),
+                    source=source,
+                    verified=True
+                ))
+        
+        # Known usernames feed the username predictor
+        known_usernames = [identities[key] for key in ("github", "twitter", "reddit") if identities.get(key)]
+        
+        # Run the independent analysis stages concurrently in worker threads:
+        # trackers, graph export, recommendations, timeline, threat intel, predictions
+        (
+            trackers,
+            graph_data,
+            recommendations,
+            (timeline_events, timeline_stats),
+            threat_matrix,
+            (predictions, predictions_risk),
+        ) = await asyncio.gather(
+            asyncio.to_thread(tracker_detector.detect_trackers, unified_profile),
+            asyncio.to_thread(graph_engine.export_json),
+            asyncio.to_thread(_build_recommendations, osint_data, total_score),
+            asyncio.to_thread(_build_timeline, osint_data),
+            asyncio.to_thread(_build_threat_matrix, osint_data, total_score, graph_engine.graph),
+            asyncio.to_thread(_build_predictions, known_usernames, osint_data),
+        )
         
-        # Create scan result
+        # Create scan result. Platform links, findings, trackers and username
+        # predictions are built here from trusted values, so they skip
+        # validation via model_construct; only ScanInput is validated on the way in
         scan_result = ScanResult(
             scan_id=scan_id,
-            email=scan_input.email,
+            email=handles["email"],
             platforms=platforms,
             profile_summary={
                 "name": unified_profile.get("personal_info", {}).get("name", "Unknown"),
@@ -400,7 +646,7 @@ async def initiate_scan(scan_input: ScanInput):
             risk_score=risk_score,
             graph_data=graph_data,
             detailed_findings=detailed_findings,
-            trackers=[Tracker(
+            trackers=[Tracker.model_construct(
                 name=tracker["name"],
                 tracking_methods=tracker["methods"],
                 confidence=tracker["confidence"]
@@ -417,35 +663,18 @@ async def initiate_scan(scan_input: ScanInput):
             predictions_risk=PredictionRiskAssessment(**predictions_risk)
         )
         
-        # Cache the result for later retrieval
-        import os
-        import json
+        # Cache the result for later retrieval; the disk write happens in the background
+        _remember_scan_result(scan_id, scan_result)
+        _remember_scan_input(input_key, scan_id)
+        # Dump once and share the dict between the cache write and the response
+        result_dict = scan_result.model_dump()
+        task = asyncio.create_task(_persist_scan_result(scan_id, result_dict, input_key))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
         
-        # Create cache directory if it doesn't exist
-        cache_dir = "scan_cache"
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
-        
-        # Save result to cache file
-        cache_file = os.path.join(cache_dir, f"{scan_id}.json")
-        try:
-            # Convert datetime to string for JSON serialization
-            result_dict = scan_result.dict()
-            result_dict["created_at"] = result_dict["created_at"].isoformat()
-            
-            # Handle datetime objects in new fields
-            if "timeline" in result_dict and result_dict["timeline"]:
-                for event in result_dict["timeline"]:
-                    if "timestamp" in event and hasattr(event["timestamp"], 'isoformat'):
-                        event["timestamp"] = event["timestamp"].isoformat()
-            
-            with open(cache_file, 'w') as f:
-                json.dump(result_dict, f)
-        except Exception as cache_error:
-            # Log error but don't fail the scan
-            print(f"Warning: Failed to cache scan result: {cache_error}")
-        
-        return scan_result
+        # Returning the response directly skips FastAPI re-validating and
+        # re-encoding the whole result; response_model still documents it
+        return ORJSONResponse(result_dict)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Scan failed: {str(e)}")
@@ -454,101 +683,101 @@ async def initiate_scan(scan_input: ScanInput):
 @app.get("/api/v1/scan/{scan_id}", response_model=ScanResult)
 async def get_scan_result(scan_id: str):
     """Get the result of a previously initiated scan"""
-    # Retrieve results from cache
-    import os
-    import json
+    # Serve recent scans straight from memory
+    cached_result = scan_result_cache.get(scan_id)
+    if cached_result is not None:
+        scan_result_cache.move_to_end(scan_id)
+        return ORJSONResponse(cached_result.model_dump())
     
-    # Check cache directory
-    cache_dir = "scan_cache"
-    cache_file = os.path.join(cache_dir, f"{scan_id}.json")
+    # Fall back to the persistent store
+    try:
+        cached_data = await _load_cached_scan(scan_id)
+        if cached_data is not None:
+            scan_result = _construct_scan_result(cached_data)
+            _remember_scan_result(scan_id, scan_result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading cached result: {str(e)}")
     
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-                # Convert datetime strings back to datetime objects
-                cached_data["created_at"] = datetime.fromisoformat(cached_data["created_at"].replace('Z', '+00:00'))
-                # Convert lists of objects
-                for i, tracker in enumerate(cached_data["trackers"]):
-                    cached_data["trackers"][i] = Tracker(**tracker)
-                for i, finding in enumerate(cached_data["detailed_findings"]):
-                    cached_data["detailed_findings"][i] = DetailedFinding(**finding)
-                for i, prediction in enumerate(cached_data["username_predictions"]):
-                    cached_data["username_predictions"][i] = UsernamePrediction(**prediction)
-                for i, platform in enumerate(cached_data["platforms"]):
-                    cached_data["platforms"][i] = PlatformLink(**platform)
-                
-                # Handle new fields if they exist in cached data
-                if "recommendations" in cached_data and cached_data["recommendations"]:
-                    cached_data["recommendations"] = [Recommendation(**rec) for rec in cached_data["recommendations"]]
-                if "timeline" in cached_data and cached_data["timeline"]:
-                    for i, event in enumerate(cached_data["timeline"]):
-                        # Convert timestamp string back to datetime
-                        if "timestamp" in event and isinstance(event["timestamp"], str):
-                            event["timestamp"] = datetime.fromisoformat(event["timestamp"].replace('Z', '+00:00'))
-                        cached_data["timeline"][i] = TimelineEvent(**event)
-                if "threat_intelligence" in cached_data and cached_data["threat_intelligence"]:
-                    cached_data["threat_intelligence"] = ThreatIntelligenceMatrix(**cached_data["threat_intelligence"])
-                if "predictions_risk" in cached_data and cached_data["predictions_risk"]:
-                    cached_data["predictions_risk"] = PredictionRiskAssessment(**cached_data["predictions_risk"])
-                
-                return ScanResult(**cached_data)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error loading cached result: {str(e)}")
-    else:
+    if cached_data is None:
         raise HTTPException(status_code=404, detail="Scan result not found")
+    return ORJSONResponse(scan_result.model_dump())
 
 # Breach check endpoint
+# HIBP breach check responses per email (bounded LRU with expiry), so UI
+# polling and retries don't repeat the rate-limited round-trip
+BREACH_CACHE_TTL = 3600  # Seconds
+BREACH_CACHE_MAX_ENTRIES = 4096
+breach_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()  # email -> (response, expires_at)
+
+def _remember_breaches(email: str, response: Dict[str, Any]):
+    breach_cache[email] = (response, time.monotonic() + BREACH_CACHE_TTL)
+    breach_cache.move_to_end(email)
+    while len(breach_cache) > BREACH_CACHE_MAX_ENTRIES:
+        breach_cache.popitem(last=False)
+
+def _lookup_breaches(email: str) -> Optional[Dict[str, Any]]:
+    entry = breach_cache.get(email)
+    if entry is None:
+        return None
+    response, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del breach_cache[email]
+        return None
+    breach_cache.move_to_end(email)
+    return response
+
 @app.get("/api/v1/breach-check/{email}")
 async def check_breaches(email: str):
     """Check if an email has been involved in known data breaches"""
-    # Query the HaveIBeenPwned API
-    import requests
-    import hashlib
+    cached_response = _lookup_breaches(email)
+    if cached_response is not None:
+        return cached_response
     
+    # Query the HaveIBeenPwned API
     try:
         # Rate limit to be ethical
         from utils.rate_limiter import rate_limit
         await rate_limit("hibp")
         
-        # HIBP uses k-anonymity, so we only send the first 5 characters of the SHA1 hash
-        sha1_hash = hashlib.sha1(email.encode('utf-8')).hexdigest().upper()
-        prefix = sha1_hash[:5]
-        suffix = sha1_hash[5:]
-        
-        # Query HIBP API
-        url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{email}?truncateResponse=false"
-        headers = {
-            "User-Agent": "DFM-OSINT-Tool"
-        }
-        
-        # For demo purposes, we'll simulate a successful response
-        # In a real implementation with a valid API key, you would use:
-        # response = requests.get(url, headers=headers, timeout=10)
-        # response.raise_for_status()
-        # breaches = response.json()
-        
-        # Simulated response for demo
-        breaches = [
-            {
-                "Name": "Adobe",
-                "Title": "Adobe",
-                "Domain": "adobe.com",
-                "BreachDate": "2013-10-04",
-                "AddedDate": "2013-12-04T00:00:00Z",
-                "ModifiedDate": "2013-12-04T00:00:00Z",
-                "PwnCount": 152445165,
-                "Description": "In October 2013, 153 million Adobe accounts were breached...",
-                "LogoPath": "https://haveibeenpwned.com/Content/Images/PwnedLogos/Adobe.png"
-            }
-        ] if "adobe" in email.lower() else []
-        
-        return {
+        if Config.HIBP_API_KEY:
+            # Query HIBP API without blocking the event loop
+            url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{quote(email, safe='')}"
+            response = await get_http_client().get(
+                url,
+                params={"truncateResponse": "false"},
+                headers={"hibp-api-key": Config.HIBP_API_KEY}
+            )
+            # HIBP answers 404 when the account is not in any breach
+            if response.status_code == 404:
+                breaches = []
+            else:
+                response.raise_for_status()
+                breaches = response.json()
+        else:
+            # Simulated response for demo (no API key configured)
+            breaches = [
+                {
+                    "Name": "Adobe",
+                    "Title": "Adobe",
+                    "Domain": "adobe.com",
+                    "BreachDate": "2013-10-04",
+                    "AddedDate": "2013-12-04T00:00:00Z",
+                    "ModifiedDate": "2013-12-04T00:00:00Z",
+                    "PwnCount": 152445165,
+                    "Description": "In October 2013, 153 million Adobe accounts were breached...",
+                    "LogoPath": "https://haveibeenpwned.com/Content/Images/PwnedLogos/Adobe.png"
+                }
+            ] if "adobe" in email.lower() else []
+        
+        result = {
             "email": email,
             "breaches_found": len(breaches),
             "breaches": breaches,
             "checked_at": datetime.now().isoformat()
         }
+        # Errors (below) are not cached, so the next request retries
+        _remember_breaches(email, result)
+        return result
     except Exception as e:
         # Return empty result on error to avoid exposing internal errors
         return {
@@ -559,69 +788,152 @@ async def check_breaches(email: str):
             "error": "Unable to check breaches at this time"
         }
 
+# Rendered visualization HTML per scan_id (bounded LRU)
+VISUALIZATION_CACHE_MAX_ENTRIES = 64
+visualization_cache: "OrderedDict[str, str]" = OrderedDict()
+
+def _remember_visualization(scan_id: str, html_content: str):
+    visualization_cache[scan_id] = html_content
+    visualization_cache.move_to_end(scan_id)
+    while len(visualization_cache) > VISUALIZATION_CACHE_MAX_ENTRIES:
+        visualization_cache.popitem(last=False)
+
+# Styled vis-network JSON per scan_id for the static graph viewer (bounded LRU)
+network_data_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+def _remember_network_data(scan_id: str, payload: bytes):
+    network_data_cache[scan_id] = payload
+    network_data_cache.move_to_end(scan_id)
+    while len(network_data_cache) > VISUALIZATION_CACHE_MAX_ENTRIES:
+        network_data_cache.popitem(last=False)
+
+# Static vis-network page that renders /api/v1/graph/data in the browser
+GRAPH_VIEWER_FILE = Path(__file__).parent / "static" / "graph.html"
+
+def _graph_nodes(graph_data: Dict[str, Any]):
+    """Yield (node_id, attributes) pairs from exported graph data"""
+    for node_data in graph_data["nodes"]:
+        # Handle the attributes properly (copy so cached data is untouched)
+        attributes = dict(node_data.get("attributes", {}))
+        if "type" not in attributes and "type" in node_data:
+            attributes["type"] = node_data["type"]
+        if "value" not in attributes and "label" in node_data:
+            attributes["value"] = node_data["label"]
+        yield node_data["id"], attributes
+
+def _graph_edges(graph_data: Dict[str, Any]):
+    """Yield (source, target, attributes) triples from exported graph data"""
+    for edge_data in graph_data["edges"]:
+        attributes = dict(edge_data.get("attributes", {}))
+        if "relationship" not in attributes and "title" in edge_data:
+            attributes["relationship"] = edge_data["title"]
+        yield edge_data["from"], edge_data["to"], attributes
+
+def _render_graph_html(graph_data: Dict[str, Any]) -> str:
+    """Render exported graph data with PyVis"""
+    # Exported data already holds unique nodes and edges, so it is fed to
+    # PyVis directly instead of rebuilding a NetworkX graph first
+    return visualization_engine.create_interactive_graph_from_data(
+        _graph_nodes(graph_data), _graph_edges(graph_data)
+    )
+
 # Graph visualization endpoint
 @app.get("/api/v1/graph/visualize/{scan_id}")
 async def visualize_graph(scan_id: str):
     """Get interactive graph visualization HTML"""
-    # Generate a visualization from stored data
-    import os
-    import json
-    
-    # Check cache directory
-    cache_dir = "scan_cache"
-    cache_file = os.path.join(cache_dir, f"{scan_id}.json")
+    # Scan results never change, so rendered HTML can be reused
+    html_content = visualization_cache.get(scan_id)
+    if html_content is not None:
+        visualization_cache.move_to_end(scan_id)
+        return {
+            "scan_id": scan_id,
+            "visualization_available": True,
+            "html_content": html_content
+        }
     
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-                
-            # Generate visualization using our visualization engine
-            from engines.visualization import visualization_engine
-            import networkx as nx
-            
-            # Recreate the intelligence graph from cached data
-            G = nx.Graph()
-            
-            # Add nodes from cached graph data
-            for node_data in cached_data["graph_data"]["nodes"]:
-                # Handle the attributes properly
-                attributes = node_data.get("attributes", {})
-                if "type" not in attributes and "type" in node_data:
-                    attributes["type"] = node_data["type"]
-                if "value" not in attributes and "label" in node_data:
-                    attributes["value"] = node_data["label"]
-                G.add_node(node_data["id"], **attributes)
-                
-            # Add edges from cached graph data
-            for edge_data in cached_data["graph_data"]["edges"]:
-                # Handle the attributes properly
-                attributes = edge_data.get("attributes", {})
-                if "relationship" not in attributes and "title" in edge_data:
-                    attributes["relationship"] = edge_data["title"]
-                G.add_edge(edge_data["from"], edge_data["to"], **attributes)
-            
-            # Generate interactive HTML visualization
-            html_content = visualization_engine.create_interactive_graph(G)
-            
+    # Generate a visualization from stored data; recent scans are in memory
+    # (their persisted copies may still be being written)
+    cached_result = scan_result_cache.get(scan_id)
+    try:
+        # Another worker (or an earlier run) may have rendered it already
+        html_content = await _load_cached_html(scan_id)
+        if html_content is not None:
+            _remember_visualization(scan_id, html_content)
             return {
                 "scan_id": scan_id,
                 "visualization_available": True,
                 "html_content": html_content
             }
-        except Exception as e:
+        
+        if cached_result is not None:
+            graph_data = cached_result.graph_data
+        else:
+            graph_data = await _load_cached_graph(scan_id)
+        
+        if graph_data is None:
             return {
                 "scan_id": scan_id,
                 "visualization_available": False,
-                "error": f"Error generating visualization: {str(e)}"
+                "error": "Scan result not found"
             }
-    else:
+            
+        # Render off the event loop; PyVis HTML generation is slow on big graphs
+        html_content = await asyncio.to_thread(_render_graph_html, graph_data)
+        _remember_visualization(scan_id, html_content)
+        task = asyncio.create_task(_persist_html(scan_id, html_content))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        
+        return {
+            "scan_id": scan_id,
+            "visualization_available": True,
+            "html_content": html_content
+        }
+    except Exception as e:
         return {
             "scan_id": scan_id,
             "visualization_available": False,
-            "error": "Scan result not found"
+            "error": f"Error generating visualization: {str(e)}"
         }
 
+# Graph data endpoint
+@app.get("/api/v1/graph/data/{scan_id}")
+async def get_graph_data(scan_id: str):
+    """Get styled graph nodes and edges for client-side rendering"""
+    payload = network_data_cache.get(scan_id)
+    if payload is not None:
+        network_data_cache.move_to_end(scan_id)
+        return Response(content=payload, media_type="application/json")
+    
+    cached_result = scan_result_cache.get(scan_id)
+    try:
+        if cached_result is not None:
+            graph_data = cached_result.graph_data
+        else:
+            graph_data = await _load_cached_graph(scan_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading graph data: {str(e)}")
+    
+    if graph_data is None:
+        raise HTTPException(status_code=404, detail="Scan result not found")
+    
+    # Serialize once; scan results never change
+    network_data = visualization_engine.build_network_data(_graph_nodes(graph_data), _graph_edges(graph_data))
+    payload = orjson.dumps(network_data, option=orjson.OPT_NON_STR_KEYS)
+    _remember_network_data(scan_id, payload)
+    return Response(content=payload, media_type="application/json")
+
+# Static graph viewer (open with ?scan_id=...)
+@app.get("/api/v1/graph/view")
+async def graph_viewer():
+    """Serve the static graph viewer page"""
+    return FileResponse(GRAPH_VIEWER_FILE, media_type="text/html",
+                        headers={"Cache-Control": "public, max-age=86400"})
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8004)
\ No newline at end of file
+    # Multiple workers need the app as an import string; "auto" picks uvloop
+    # and httptools (uvicorn[standard]) where they are available, which
+    # excludes uvloop on Windows
+    uvicorn.run("main:app", host="0.0.0.0", port=8004, workers=Config.WEB_CONCURRENCY,
+                loop="auto", http="auto")
\ No newline at end of file
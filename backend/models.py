@@ -1,18 +1,21 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, Index, JSON, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
-import json
 
 Base = declarative_base()
 
+# Native JSON column: JSONB on PostgreSQL, the generic JSON type elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 class ScanSession(Base):
     __tablename__ = 'scan_sessions'
     
     id = Column(Integer, primary_key=True)
-    scan_id = Column(String(50), unique=True, nullable=False)
+    scan_id = Column(String(50), unique=True, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    email = Column(String(255), nullable=False)
+    email = Column(String(255), nullable=False, index=True)
     github_username = Column(String(100), nullable=False)
     linkedin_url = Column(Text, nullable=False)
     twitter_handle = Column(String(100))
@@ -33,11 +36,11 @@ class ScanResult(Base):
     __tablename__ = 'scan_results'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     username = Column(String(100), nullable=False)
-    profile_data = Column(Text)  # JSON string
-    emails = Column(Text)  # JSON array string
-    organizations = Column(Text)  # JSON array string
+    profile_data = Column(JSONType)
+    emails = Column(JSONType)  # List of email addresses
+    organizations = Column(JSONType)  # List of organization names
     risk_score_overall = Column(Integer)
     risk_score_sensitivity = Column(Integer)
     risk_score_cross_platform = Column(Integer)
@@ -52,12 +55,12 @@ class PlatformLink(Base):
     __tablename__ = 'platform_links'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     name = Column(String(50), nullable=False)
     handle = Column(String(100), nullable=False)
     url = Column(Text, nullable=False)
     source = Column(String(20), nullable=False)  # "mandatory", "optional", "discovered"
-    verified = Column(Integer, default=0)  # 0 or 1 for boolean
+    verified = Column(Boolean, default=False, nullable=False)
     
     # Relationships
     session = relationship("ScanSession", back_populates="platforms")
@@ -66,14 +69,14 @@ class Repository(Base):
     __tablename__ = 'repositories'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     name = Column(String(100), nullable=False)
     description = Column(Text)
     url = Column(Text, nullable=False)
     stars = Column(Integer, default=0)
     forks = Column(Integer, default=0)
     last_updated = Column(String(20))  # Date string
-    has_secrets = Column(Integer, default=0)  # 0 or 1 for boolean
+    has_secrets = Column(Boolean, default=False, nullable=False, index=True)
     secret_count = Column(Integer, default=0)
     
     # Relationships
@@ -83,7 +86,7 @@ class Finding(Base):
     __tablename__ = 'findings'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     type = Column(String(50), nullable=False)
     severity = Column(String(10), nullable=False)  # "critical", "high", "medium", "low"
     description = Column(Text, nullable=False)
@@ -92,18 +95,23 @@ class Finding(Base):
     
     # Relationships
     session = relationship("ScanSession", back_populates="findings")
+    
+    __table_args__ = (
+        # Findings are usually listed per session filtered by severity
+        Index('ix_findings_session_severity', 'session_id', 'severity'),
+    )
 
 class Breach(Base):
     __tablename__ = 'breaches'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     name = Column(String(100), nullable=False)
     date = Column(String(20), nullable=False)  # Date string
     email = Column(String(255), nullable=False)
     description = Column(Text)
     severity = Column(String(10), nullable=False)  # "critical", "high", "medium", "low"
-    data_types = Column(Text)  # JSON array string
+    data_types = Column(JSONType)  # List of exposed data types
     
     # Relationships
     session = relationship("ScanSession", back_populates="breaches")
@@ -112,15 +120,20 @@ class Tracker(Base):
     __tablename__ = 'trackers'
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer, ForeignKey('scan_sessions.id'))
+    session_id = Column(Integer, ForeignKey('scan_sessions.id'), index=True)
     name = Column(String(100), nullable=False)
-    methods = Column(Text)  # JSON array string
+    methods = Column(JSONType)  # List of tracking methods
     confidence = Column(Integer)  # 0-100 as integer
     explanation = Column(Text)
     url = Column(Text)
     
     # Relationships
     session = relationship("ScanSession", back_populates="trackers")
+    
+    __table_args__ = (
+        # Containment queries on tracking methods (PostgreSQL only)
+        Index('ix_tracker_methods', 'methods', postgresql_using='gin'),
+    )
 
 # Patterns table for username prediction
 class UsernamePattern(Base):
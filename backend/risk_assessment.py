@@ -1,7 +1,11 @@
 # risk_assessment.py
 """Generate actionable security recommendations based on OSINT findings"""
 
+from operator import itemgetter
+
 class SecurityRecommendations:
+    PRIORITY_SCORES = {'CRITICAL': 4, 'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
+    
     def __init__(self, osint_data, risk_score):
         self.osint_data = osint_data
         self.risk_score = risk_score
@@ -12,7 +16,7 @@ class SecurityRecommendations:
         
         # CRITICAL: High risk score
         if self.risk_score >= 70:
-            self.recommendations.append({
+            self._add_recommendation({
                 'priority': 'CRITICAL',
                 'icon': '⚠️',
                 'title': 'Change All Passwords Immediately',
@@ -26,7 +30,7 @@ class SecurityRecommendations:
         exposed_secrets = self.osint_data.get('exposed_secrets', [])
         if exposed_secrets:
             secret_count = len(exposed_secrets)
-            self.recommendations.append({
+            self._add_recommendation({
                 'priority': 'HIGH',
                 'icon': '🔑',
                 'title': f'Rotate {secret_count} Exposed API Keys',
@@ -42,15 +46,16 @@ class SecurityRecommendations:
             })
         
         # 2FA not enabled
-        linked_platforms = len(self.osint_data.get('platforms', {}))
+        platforms = self.osint_data.get('platforms', {})
+        linked_platforms = len(platforms)
         if linked_platforms > 0:
-            self.recommendations.append({
+            self._add_recommendation({
                 'priority': 'HIGH',
                 'icon': '🔒',
                 'title': f'Enable 2FA on {linked_platforms} Accounts',
                 'description': 'Two-factor authentication significantly reduces account takeover risk.',
                 'action': 'Enable 2FA on each platform account',
-                'platforms': list(self.osint_data.get('platforms', {}).keys()),
+                'platforms': list(platforms),
                 'time_to_fix': '20 minutes',
                 'severity': 'high'
             })
@@ -58,14 +63,14 @@ class SecurityRecommendations:
         # Email in breaches
         breaches = self.osint_data.get('breaches', {})
         if breaches:
-            total_breaches = sum(len(v) for v in breaches.values())
-            self.recommendations.append({
+            total_breaches = sum(map(len, breaches.values()))
+            self._add_recommendation({
                 'priority': 'MEDIUM',
                 'icon': '📧',
                 'title': f'Email Exposed in {total_breaches} Data Breaches',
                 'description': 'Your email appears in known data breaches. Monitor for unauthorized access.',
                 'action': 'Check HaveIBeenPwned.com for details',
-                'url': f'https://haveibeenpwned.com/search?q={list(breaches.keys())[0] if breaches else ""}',
+                'url': f'https://haveibeenpwned.com/search?q={next(iter(breaches), "")}',
                 'time_to_fix': '5 minutes',
                 'severity': 'medium'
             })
@@ -73,7 +78,7 @@ class SecurityRecommendations:
         # Privacy review
         trackers = self.osint_data.get('trackers', [])
         if trackers:
-            self.recommendations.append({
+            self._add_recommendation({
                 'priority': 'MEDIUM',
                 'icon': '👁️',
                 'title': f'Review Privacy Settings - {len(trackers)} Trackers Detected',
@@ -86,7 +91,7 @@ class SecurityRecommendations:
         
         # Location exposure
         if self.osint_data.get('locations'):
-            self.recommendations.append({
+            self._add_recommendation({
                 'priority': 'LOW',
                 'icon': '📍',
                 'title': 'Limit Location Information',
@@ -98,14 +103,12 @@ class SecurityRecommendations:
         
         return self.recommendations
     
+    def _add_recommendation(self, rec):
+        """Append a recommendation with its priority score attached"""
+        rec['priority_score'] = self.PRIORITY_SCORES.get(rec['priority'], 0)
+        self.recommendations.append(rec)
+    
     def get_priority_score(self):
-        """Calculate action priority score for sorting"""
-        priority_map = {'CRITICAL': 4, 'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
-        
-        scored = []
-        for rec in self.recommendations:
-            score = priority_map.get(rec['priority'], 0)
-            rec['priority_score'] = score
-            scored.append(rec)
-        
-        return sorted(scored, key=lambda x: x['priority_score'], reverse=True)
\ No newline at end of file
+        """Return recommendations sorted by action priority score"""
+        # Scores are attached on append, so this is just the sort
+        return sorted(self.recommendations, key=itemgetter('priority_score'), reverse=True)
\ No newline at end of file
@@ -4,7 +4,8 @@ Test Script for Backend API
 This script tests the main endpoints of the OSINT backend API.
 """
 
-import requests
+import asyncio
+import httpx
 import json
 from datetime import datetime
 
@@ -12,18 +13,16 @@ from datetime import datetime
 import os
 BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:8004')
 
-def test_health_check():
+async def check_health(client: httpx.AsyncClient):
     """Test the health check endpoint"""
+    response = await client.get("/health")
     print("Testing health check...")
-    response = requests.get(f"{BASE_URL}/health")
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
     print()
 
-def test_scan_endpoint():
+async def check_scan_endpoint(client: httpx.AsyncClient):
     """Test the scan endpoint with sample data"""
-    print("Testing scan endpoint...")
-    
     # Sample scan data
     scan_data = {
         "email": "test@example.com",
@@ -33,12 +32,9 @@ def test_scan_endpoint():
         "reddit": "testuser"
     }
     
-    response = requests.post(
-        f"{BASE_URL}/api/v1/scan",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(scan_data)
-    )
+    response = await client.post("/api/v1/scan", json=scan_data)
     
+    print("Testing scan endpoint...")
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
         result = response.json()
@@ -47,13 +43,12 @@ def test_scan_endpoint():
         print(f"Error: {response.text}")
     print()
 
-def test_breach_check():
+async def check_breach_endpoint(client: httpx.AsyncClient):
     """Test the breach check endpoint"""
-    print("Testing breach check endpoint...")
-    
     email = "test@example.com"
-    response = requests.get(f"{BASE_URL}/api/v1/breach-check/{email}")
+    response = await client.get(f"/api/v1/breach-check/{email}")
     
+    print("Testing breach check endpoint...")
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
         result = response.json()
@@ -62,10 +57,8 @@ def test_breach_check():
         print(f"Error: {response.text}")
     print()
 
-def test_graph_visualization():
+async def check_graph_visualization(client: httpx.AsyncClient):
     """Test the graph visualization endpoint"""
-    print("Testing graph visualization endpoint...")
-    
     # First, we need to create a scan to get a scan_id
     scan_data = {
         "email": "test@example.com",
@@ -74,12 +67,9 @@ def test_graph_visualization():
     }
     
     # Create a scan
-    response = requests.post(
-        f"{BASE_URL}/api/v1/scan",
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(scan_data)
-    )
+    response = await client.post("/api/v1/scan", json=scan_data)
     
+    print("Testing graph visualization endpoint...")
     if response.status_code == 200:
         scan_result = response.json()
         # Extract scan_id from the response or generate one
@@ -90,18 +80,26 @@ def test_graph_visualization():
         print(f"Error creating scan for graph test: {response.text}")
     print()
 
+async def main():
+    # One client for all tests so connections are reused; the tests run
+    # concurrently and each prints its output once its responses are in
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=None) as client:
+        await asyncio.gather(
+            check_health(client),
+            check_scan_endpoint(client),
+            check_breach_endpoint(client),
+            check_graph_visualization(client),
+        )
+
 if __name__ == "__main__":
     print(f"Testing OSINT Backend API at {BASE_URL}")
     print("=" * 50)
     
     try:
-        test_health_check()
-        test_scan_endpoint()
-        test_breach_check()
-        test_graph_visualization()
+        asyncio.run(main())
         
         print("All tests completed!")
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"Error: Could not connect to the backend server at {BASE_URL}. Make sure it's running.")
         print("To start the backend server:")
         print("1. Navigate to the backend directory: cd backend")
@@ -109,4 +107,4 @@ if __name__ == "__main__":
         print("")
         print("Alternatively, run the start_system.bat file from the project root to start both frontend and backend.")
     except Exception as e:
-        print(f"Error during testing: {str(e)}")
\ No newline at end of file
+        print(f"Error during testing: {str(e)}")
@@ -1,7 +1,6 @@
 """Test script for the enhanced IntelligenceGraph implementation."""
 
 from engines.intelligence_graph import IntelligenceGraph
-import json
 
 def test_intelligence_graph():
     """Test the enhanced IntelligenceGraph functionality."""
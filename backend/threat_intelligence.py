@@ -1,13 +1,29 @@
 # threat_intelligence.py
 """Sophisticated threat intelligence analysis"""
 
+from functools import cached_property
+
 class ThreatIntelligence:
+    # Recommendation priorities counted as urgent in the matrix
+    URGENT_PRIORITIES = frozenset({'CRITICAL', 'HIGH'})
+    
     def __init__(self, osint_data, risk_score, graph):
+        # Scores are cached per instance, so osint_data must not be mutated
+        # after construction
         self.osint_data = osint_data
         self.risk_score = risk_score
         self.graph = graph
+        
+        # Inputs shared by several calculators, looked up once
+        self.has_emails = bool(osint_data.get('emails'))
+        self.has_phone = bool(osint_data.get('phone'))
+        self.has_locations = bool(osint_data.get('locations'))
+        self.has_organizations = bool(osint_data.get('organizations'))
+        self.platform_count = len(osint_data.get('platforms', {}))
+        self.breaches = osint_data.get('breaches', {})
     
-    def calculate_identity_reconstruction_risk(self):
+    @cached_property
+    def identity_reconstruction_risk(self):
         """
         What % of identity can be reconstructed from public data?
         Formula: (data_points_found / total_possible_datapoints) * 100
@@ -15,11 +31,11 @@ class ThreatIntelligence:
         max_possible = 100  # Email, phone, address, work, education, social media x5, etc.
         
         data_points = 0
-        data_points += 10 if self.osint_data.get('emails') else 0
-        data_points += 10 if self.osint_data.get('phone') else 0
-        data_points += 10 if self.osint_data.get('locations') else 0
-        data_points += 10 if self.osint_data.get('organizations') else 0
-        data_points += len(self.osint_data.get('platforms', {})) * 8
+        data_points += 10 if self.has_emails else 0
+        data_points += 10 if self.has_phone else 0
+        data_points += 10 if self.has_locations else 0
+        data_points += 10 if self.has_organizations else 0
+        data_points += self.platform_count * 8
         data_points += 10 if self.osint_data.get('repositories') else 0
         data_points += 10 if self.osint_data.get('websites') else 0
         data_points += 5 if self.osint_data.get('profile_bio') else 0
@@ -27,46 +43,48 @@ class ThreatIntelligence:
         percentage = min((data_points / max_possible) * 100, 100)
         return round(percentage, 1)
     
-    def calculate_phishing_vulnerability(self):
+    @cached_property
+    def phishing_vulnerability(self):
         """
         Risk of successful phishing attack
         Formula: email_exposed * workplace_known * location_known * account_count
         """
-        email_risk = 30 if self.osint_data.get('emails') else 0
-        workplace_risk = 20 if self.osint_data.get('organizations') else 0
-        location_risk = 15 if self.osint_data.get('locations') else 0
-        social_risk = min(len(self.osint_data.get('platforms', {})) * 5, 20)
+        email_risk = 30 if self.has_emails else 0
+        workplace_risk = 20 if self.has_organizations else 0
+        location_risk = 15 if self.has_locations else 0
+        social_risk = min(self.platform_count * 5, 20)
         
         total = min(email_risk + workplace_risk + location_risk + social_risk, 100)
         return round(total, 1)
     
-    def calculate_account_takeover_risk(self):
+    @cached_property
+    def account_takeover_risk(self):
         """
         Risk of account compromise
         Formula: exposed_secrets * account_count * breach_count
         """
         secrets_risk = min(len(self.osint_data.get('exposed_secrets', [])) * 15, 40)
-        accounts_risk = min(len(self.osint_data.get('platforms', {})) * 8, 30)
-        breach_risk = min(sum(1 for v in self.osint_data.get('breaches', {}).values() 
-                             for _ in v) * 5, 30)
+        accounts_risk = min(self.platform_count * 8, 30)
+        breach_risk = min(sum(map(len, self.breaches.values())) * 5, 30)
         
         total = min(secrets_risk + accounts_risk + breach_risk, 100)
         return round(total, 1)
     
-    def calculate_data_broker_aggregation(self):
+    @cached_property
+    def data_broker_aggregation(self):
         """
         How many commercial data brokers have your info?
         Typical: 100+ data brokers worldwide
         """
         base_risk = 50  # Everyone is on some data brokers
         
-        if self.osint_data.get('emails'):
+        if self.has_emails:
             base_risk += 20
-        if self.osint_data.get('phone'):
+        if self.has_phone:
             base_risk += 15
-        if self.osint_data.get('locations'):
+        if self.has_locations:
             base_risk += 10
-        if self.osint_data.get('breaches'):
+        if self.breaches:
             base_risk += 15
         
         return min(round(base_risk, 1), 100)
@@ -74,12 +92,12 @@ class ThreatIntelligence:
     def get_threat_matrix(self):
         """Return complete threat intelligence matrix"""
         return {
-            'identity_reconstruction_risk': self.calculate_identity_reconstruction_risk(),
-            'phishing_vulnerability': self.calculate_phishing_vulnerability(),
-            'account_takeover_risk': self.calculate_account_takeover_risk(),
-            'data_broker_aggregation': self.calculate_data_broker_aggregation(),
+            'identity_reconstruction_risk': self.identity_reconstruction_risk,
+            'phishing_vulnerability': self.phishing_vulnerability,
+            'account_takeover_risk': self.account_takeover_risk,
+            'data_broker_aggregation': self.data_broker_aggregation,
             'overall_risk_score': self.risk_score,
-            'estimated_data_brokers': round(self.calculate_data_broker_aggregation() * 1.5),  # Estimate count
-            'recommendations_count': len([r for r in self.osint_data.get('recommendations', []) 
-                                         if r['priority'] in ['CRITICAL', 'HIGH']])
+            'estimated_data_brokers': round(self.data_broker_aggregation * 1.5),  # Estimate count
+            'recommendations_count': sum(1 for r in self.osint_data.get('recommendations', ())
+                                         if r['priority'] in self.URGENT_PRIORITIES)
         }
\ No newline at end of file
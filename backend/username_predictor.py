@@ -1,16 +1,57 @@
 # username_predictor.py
 """Machine learning-based username prediction across platforms"""
 
-import re
-from itertools import product
+import heapq
 from datetime import datetime
+from operator import itemgetter
 
 class UsernamePrediction:
+    # L33t speak substitutions, one translate table per letter (both cases)
+    LEET_TABLES = [
+        (old_char, str.maketrans({old_char: new_char, old_char.upper(): new_char}))
+        for old_char, new_char in {'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'}.items()
+    ]
+    LEET_CHARS = frozenset(old_char for old_char, _ in LEET_TABLES)
+    
+    # Common number suffixes (recent years are added per instance)
+    NUMBER_SUFFIXES = [
+        123, 2024, 2025, 2023, 2022,  # Years
+        1, 42,                        # Common numbers
+    ]
+    
+    # Common prefixes/suffixes
+    PREFIXES = ['', 'real_', 'the_', 'official_', '_']
+    SUFFIXES = ['_', '_official', '_tv', '___', '123']
+    
     def __init__(self, known_usernames, osint_data):
         self.known_usernames = known_usernames
         self.osint_data = osint_data
         self.predictions = []
         
+        # Known usernames for O(1) skips, and each predicted username's index
+        # in self.predictions so a repeat replaces it in place
+        self._known = set(known_usernames)
+        self._positions = {}
+        
+        current_year = datetime.now().year
+        self.number_suffixes = self.NUMBER_SUFFIXES + [current_year, current_year - 1]  # Recent years
+        
+        # Fixed variants as (prefix, suffix, confidence, reason), built once so
+        # each known username only needs string concatenation
+        self._number_templates = [
+            ('', str(num), 0.65 - (num > 1000) * 0.05,  # Slight boost for recent years
+             f'Common pattern: username + {num}')
+            for num in self.number_suffixes
+        ]
+        # Affix templates also record whether the affix adds an underscore
+        self._affix_templates = [
+            (prefix, '', 0.55 - len(prefix) * 0.05, f'Prefix variant: {prefix}', '_' in prefix)
+            for prefix in self.PREFIXES
+        ] + [
+            ('', suffix, 0.55 - len(suffix) * 0.05, f'Suffix variant: {suffix}', '_' in suffix)
+            for suffix in self.SUFFIXES
+        ]
+        
         # Platform info for pattern matching
         self.platform_rules = {
             'instagram': {
@@ -56,74 +97,65 @@ class UsernamePrediction:
                 'confidence_boost': 0.09
             }
         }
+        
+        # (platform, max_length, allows_underscore, allows_dot) for platform checks
+        self._platform_limits = [
+            (name, rules['max_length'], rules['allows_underscore'], rules['allows_dot'])
+            for name, rules in self.platform_rules.items()
+        ]
     
     def generate_predictions(self):
         """Generate all possible username variations"""
         
         for username in self.known_usernames:
+            # Separators are scanned for once; most variants below keep them
+            # as they are, and the rest know what they changed
+            has_underscore = '_' in username
+            has_dot = '.' in username
+            flags = {'has_underscore': has_underscore, 'has_dot': has_dot}
+            
             # ===== PATTERN 1: Underscore/dot manipulation =====
-            if '_' in username:
+            if has_underscore:
                 variants = [
-                    username.replace('_', ''),           # Remove underscore
-                    username.replace('_', '.'),          # Replace with dot
-                    username.replace('_', ''),           # No separator
+                    (username.replace('_', ''), has_dot),  # Remove underscore (no separator)
+                    (username.replace('_', '.'), True),    # Replace with dot
                 ]
-                for variant in variants:
+                for variant, variant_has_dot in variants:
                     self._add_prediction(variant, 'instagram', 0.75, 
-                                       'Instagram prefers no underscores')
+                                       'Instagram prefers no underscores',
+                                       has_underscore=False, has_dot=variant_has_dot)
             
-            if '.' in username:
+            if has_dot:
                 variants = [
-                    username.replace('.', ''),           # Remove dot
-                    username.replace('.', '_'),          # Replace with underscore
+                    (username.replace('.', ''), has_underscore),  # Remove dot
+                    (username.replace('.', '_'), True),           # Replace with underscore
                 ]
-                for variant in variants:
+                for variant, variant_has_underscore in variants:
                     self._add_prediction(variant, 'tiktok', 0.70,
-                                       'TikTok doesn\'t allow dots')
+                                       'TikTok doesn\'t allow dots',
+                                       has_underscore=variant_has_underscore, has_dot=False)
             
             # ===== PATTERN 2: Number suffixes =====
-            current_year = datetime.now().year
-            number_suffixes = [
-                123, 2024, 2025, 2023, 2022,  # Years
-                1, 1, 42,                     # Common numbers
-                current_year, current_year - 1  # Recent years
-            ]
-            
-            for num in number_suffixes:
-                variant = f"{username}{num}"
-                confidence = 0.65 - (num > 1000) * 0.05  # Slight boost for recent years
-                self._add_prediction(variant, 'any', confidence,
-                                   f'Common pattern: username + {num}')
+            for prefix, suffix, confidence, reason in self._number_templates:
+                self._add_prediction(prefix + username + suffix, 'any', confidence, reason, **flags)
             
             # ===== PATTERN 3: Case variations =====
-            self._add_prediction(username.lower(), 'any', 0.60, 'Lowercase variant')
-            self._add_prediction(username.upper(), 'any', 0.50, 'Uppercase variant')
+            self._add_prediction(username.lower(), 'any', 0.60, 'Lowercase variant', **flags)
+            self._add_prediction(username.upper(), 'any', 0.50, 'Uppercase variant', **flags)
             
             # ===== PATTERN 4: Letter substitution (l33t speak) =====
-            leet_subs = {
-                'a': '4', 'e': '3', 'i': '1', 'o': '0', 's': '5', 't': '7'
-            }
-            for old_char, new_char in leet_subs.items():
-                if old_char in username.lower():
-                    variant = username.replace(old_char, new_char).replace(old_char.upper(), new_char)
-                    self._add_prediction(variant, 'gaming', 0.40,
-                                       'L33t speak variant (common in gaming)')
+            lowered = username.lower()
+            if not self.LEET_CHARS.isdisjoint(lowered):
+                for old_char, table in self.LEET_TABLES:
+                    if old_char in lowered:
+                        variant = username.translate(table)
+                        self._add_prediction(variant, 'gaming', 0.40,
+                                           'L33t speak variant (common in gaming)', **flags)
             
             # ===== PATTERN 5: Common prefixes/suffixes =====
-            prefixes = ['', 'real_', 'the_', 'official_', '_']
-            suffixes = ['_', '_official', '_tv', '___', '123']
-            
-            for prefix in prefixes:
-                variant = prefix + username
-                confidence = 0.55 - len(prefix) * 0.05
-                self._add_prediction(variant, 'any', confidence,
-                                   f'Prefix variant: {prefix}')
-            
-            for suffix in suffixes:
-                variant = username + suffix
-                confidence = 0.55 - len(suffix) * 0.05
-                self._add_prediction(variant, 'any', confidence,
-                                   f'Suffix variant: {suffix}')
+            for prefix, suffix, confidence, reason, adds_underscore in self._affix_templates:
+                self._add_prediction(prefix + username + suffix, 'any', confidence, reason,
+                                     has_underscore=has_underscore or adds_underscore, has_dot=has_dot)
             
             # ===== PATTERN 6: Historical usernames =====
             # If we found old commits, might have old usernames
@@ -133,14 +165,12 @@ class UsernamePrediction:
                     self._add_prediction(old_username, 'any', 0.45,
                                        'Extracted from historical email')
         
-        # Remove duplicates and sort by confidence
-        unique_predictions = {p['username']: p for p in self.predictions}
-        self.predictions = list(unique_predictions.values())
-        self.predictions.sort(key=lambda x: x['confidence'], reverse=True)
-        
-        return self.predictions[:20]  # Top 20 predictions
+        # Predictions are already unique per username; only the top 20 by
+        # confidence are returned, so select them without sorting everything
+        return heapq.nlargest(20, self.predictions, key=itemgetter('confidence'))
     
-    def _add_prediction(self, username, platform, confidence, reason):
+    def _add_prediction(self, username, platform, confidence, reason, *,
+                        has_underscore=None, has_dot=None):
         """Add a prediction with confidence score"""
         
         # Skip if too short/long
@@ -148,9 +178,15 @@ class UsernamePrediction:
             return
         
         # Skip if already known
-        if username in self.known_usernames:
+        if username in self._known:
             return
         
+        # Callers that already know which separators the variant has pass them in
+        if has_underscore is None:
+            has_underscore = '_' in username
+        if has_dot is None:
+            has_dot = '.' in username
+        
         # Apply platform-specific confidence boost
         if platform in self.platform_rules:
             platform_rules = self.platform_rules[platform]
@@ -158,38 +194,46 @@ class UsernamePrediction:
             if len(username) > platform_rules['max_length']:
                 return  # Too long for platform
             
-            if '_' in username and not platform_rules['allows_underscore']:
+            if has_underscore and not platform_rules['allows_underscore']:
                 confidence *= 0.7  # Reduce confidence
             
-            if '.' in username and not platform_rules['allows_dot']:
+            if has_dot and not platform_rules['allows_dot']:
                 confidence *= 0.7
             
             confidence += platform_rules.get('confidence_boost', 0)
         
-        self.predictions.append({
+        prediction = {
             'username': username,
             'platform': platform if platform != 'any' else 'Unknown',
             'confidence': round(min(confidence, 0.99), 2),  # Cap at 0.99
             'reason': reason,
-            'likely_platforms': self._get_likely_platforms(username)
-        })
+            'likely_platforms': self._get_likely_platforms(username, has_underscore, has_dot)
+        }
+        
+        # A username predicted again keeps its original position but takes
+        # the latest prediction (the last pattern to produce it wins)
+        position = self._positions.get(username)
+        if position is None:
+            self._positions[username] = len(self.predictions)
+            self.predictions.append(prediction)
+        else:
+            self.predictions[position] = prediction
     
-    def _get_likely_platforms(self, username):
+    def _get_likely_platforms(self, username, has_underscore=None, has_dot=None):
         """Determine which platforms this username likely works on"""
-        platforms = []
+        # Check character constraints once per username
+        length = len(username)
+        if has_underscore is None:
+            has_underscore = '_' in username
+        if has_dot is None:
+            has_dot = '.' in username
         
-        for platform, rules in self.platform_rules.items():
-            if len(username) <= rules['max_length']:
-                # Check character constraints
-                has_underscore = '_' in username
-                has_dot = '.' in username
-                
-                if has_underscore and not rules['allows_underscore']:
-                    continue
-                if has_dot and not rules['allows_dot']:
-                    continue
-                
-                platforms.append(platform)
+        platforms = [
+            platform for platform, max_length, allows_underscore, allows_dot in self._platform_limits
+            if length <= max_length
+            and (allows_underscore or not has_underscore)
+            and (allows_dot or not has_dot)
+        ]
         
         return platforms if platforms else ['Any']
 
@@ -3,6 +3,7 @@ Utilities Package
 
 This package contains utility modules for the OSINT application:
 - Rate limiting
+- Shared HTTP client
 - Secret detection
 - Tracker detection
 - Risk calculation
@@ -13,7 +14,8 @@ This package contains utility modules for the OSINT application:
 
 # Import utility classes for easy access
 from .rate_limiter import RateLimiter, TokenBucketRateLimiter, rate_limit, token_limit
-from .secret_detector import SecretDetector, detect_secrets, detect_secrets_with_context, detect_secrets_in_file
+from .http_client import get_http_client, close_http_client
+from .secret_detector import SecretDetector, detect_secrets, detect_secrets_with_context, detect_secrets_in_file, detect_secrets_in_files
 from .tracker_detector import TrackerDetector, detect_trackers, calculate_tracker_risk
 from .risk_calculator import RiskCalculator, calculate_risk_score
 
@@ -22,10 +24,13 @@ __all__ = [
     "TokenBucketRateLimiter",
     "rate_limit",
     "token_limit",
+    "get_http_client",
+    "close_http_client",
     "SecretDetector",
     "detect_secrets",
     "detect_secrets_with_context",
     "detect_secrets_in_file",
+    "detect_secrets_in_files",
     "TrackerDetector",
     "detect_trackers",
     "calculate_tracker_risk",
@@ -0,0 +1,39 @@
+"""HTTP Client Utility
+
+This module provides a shared async HTTP client so collectors and API
+endpoints reuse pooled connections instead of blocking the event loop.
+"""
+
+import httpx
+from typing import Optional
+
+# Default headers sent with every request (collectors may override per call)
+DEFAULT_HEADERS = {
+    "User-Agent": "DFM-OSINT-Tool"
+}
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use
+
+    Returns:
+        httpx.AsyncClient: Shared client with pooled connections
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,  # Match requests' default for scraped profile pages
+            limits=httpx.Limits(max_connections=64)
+        )
+    return _http_client
+
+async def close_http_client():
+    """Close the shared async HTTP client"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -19,8 +19,9 @@ class RateLimiter:
         """
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
-        self.last_request_time: Dict[str, float] = defaultdict(float)
-        self._lock = asyncio.Lock()
+        self.last_request_time: Dict[str, float] = {}
+        # Domains are limited independently, so each gets its own lock
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
     
     async def wait_if_needed(self, domain: str = "default"):
         """
@@ -29,15 +30,26 @@ class RateLimiter:
         Args:
             domain (str): Domain or service identifier for separate rate limiting
         """
-        async with self._lock:
-            current_time = time.time()
-            last_time = self.last_request_time[domain]
+        lock = self._locks[domain]
+        current_time = time.monotonic()
+        last_time = self.last_request_time.get(domain)
+        
+        # Fast path: nobody is waiting on this domain and the interval has
+        # passed. There is no await between the check and the update.
+        if not lock.locked() and (last_time is None or current_time - last_time >= self.min_interval):
+            self.last_request_time[domain] = current_time
+            return
+        
+        async with lock:
+            current_time = time.monotonic()
+            last_time = self.last_request_time.get(domain)
             
-            if current_time - last_time < self.min_interval:
+            if last_time is not None and current_time - last_time < self.min_interval:
                 sleep_time = self.min_interval - (current_time - last_time)
                 await asyncio.sleep(sleep_time)
+                current_time = time.monotonic()
                 
-            self.last_request_time[domain] = time.time()
+            self.last_request_time[domain] = current_time
 
 # Global rate limiter instance
 rate_limiter = RateLimiter(1.0)  # 1 request per second default
@@ -56,10 +68,19 @@ class TokenBucketRateLimiter:
             refill_rate (float): Tokens added per second
         """
         self.capacity = capacity
-        self.tokens = capacity
         self.refill_rate = refill_rate
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        # Integer milli-tokens and nanosecond timestamps keep refills exact;
+        # the remainder carries sub-milli-token refill between calls
+        self._capacity_milli = capacity * 1000
+        self._tokens_milli = self._capacity_milli
+        self._rate_milli = round(refill_rate * 1000)  # Milli-tokens per second
+        self._refill_remainder = 0
+        self.last_refill = time.monotonic_ns()
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket (as of the last refill)"""
+        return self._tokens_milli / 1000
     
     async def consume(self, tokens: int = 1) -> bool:
         """
@@ -71,21 +92,43 @@ class TokenBucketRateLimiter:
         Returns:
             bool: True if tokens were consumed, False if rate limited
         """
-        async with self._lock:
-            current_time = time.time()
-            
-            # Refill tokens based on time passed
-            time_passed = current_time - self.last_refill
-            new_tokens = time_passed * self.refill_rate
-            self.tokens = min(self.capacity, self.tokens + new_tokens)
-            self.last_refill = current_time
-            
-            # Try to consume tokens
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            else:
-                return False
+        # No awaits below, so this runs atomically on the event loop and
+        # needs no lock
+        current_time = time.monotonic_ns()
+        
+        # Refill tokens based on time passed
+        refill, self._refill_remainder = divmod(
+            (current_time - self.last_refill) * self._rate_milli + self._refill_remainder,
+            1_000_000_000
+        )
+        self.last_refill = current_time
+        if self._tokens_milli + refill >= self._capacity_milli:
+            self._tokens_milli = self._capacity_milli
+            self._refill_remainder = 0
+        else:
+            self._tokens_milli += refill
+        
+        # Try to consume tokens
+        cost = tokens * 1000
+        if self._tokens_milli >= cost:
+            self._tokens_milli -= cost
+            return True
+        else:
+            return False
+    
+    async def acquire(self, tokens: int = 1):
+        """
+        Wait until tokens are available, then consume them
+        
+        Args:
+            tokens (int): Number of tokens to consume
+        """
+        # A request larger than the bucket could never be satisfied
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+        while not await self.consume(tokens):
+            # Sleep until the missing tokens should have been refilled
+            await asyncio.sleep((tokens * 1000 - self._tokens_milli) / max(self._rate_milli, 1))
 
 # Global token bucket instance
 token_bucket_limiter = TokenBucketRateLimiter(10, 1.0)  # 10 tokens, refill 1 per second
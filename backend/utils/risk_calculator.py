@@ -6,6 +6,15 @@ OSINT findings, platform usage, and other factors.
 
 from typing import List, Dict, Any
 
+# Severity levels used to index the weight tables (unknown severities get
+# the last slot, which scores nothing)
+SEVERITY_LEVELS = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+UNKNOWN_SEVERITY_LEVEL = 4
+
+# Points added per finding, by severity level
+SEVERITY_WEIGHTS = [5, 10, 25, 40, 0]
+EXPLOITABILITY_WEIGHTS = [0, 0, 15, 30, 0]
+
 class RiskCalculator:
     def __init__(self):
         """Initialize risk calculator with default weights"""
@@ -30,8 +39,15 @@ class RiskCalculator:
         Returns:
             Dict containing risk score and breakdown
         """
+        # Resolve each finding's severity once for both severity-based scores
+        # (findings without one count as low)
+        severity_levels = [
+            SEVERITY_LEVELS.get(finding.get("severity", "low"), UNKNOWN_SEVERITY_LEVEL)
+            for finding in findings
+        ]
+        
         # Calculate data sensitivity score
-        data_sensitivity = self._calculate_data_sensitivity(findings)
+        data_sensitivity = self._calculate_data_sensitivity(severity_levels)
         
         # Calculate cross-platform correlation score
         cross_platform = self._calculate_cross_platform(platforms)
@@ -40,7 +56,7 @@ class RiskCalculator:
         recency = self._calculate_recency(findings)
         
         # Calculate exploitability score
-        exploitability = self._calculate_exploitability(findings, platforms)
+        exploitability = self._calculate_exploitability(severity_levels, platforms)
         
         # Calculate weighted total score
         total_score = (
@@ -64,19 +80,9 @@ class RiskCalculator:
             }
         }
     
-    def _calculate_data_sensitivity(self, findings: List[Dict[str, Any]]) -> float:
+    def _calculate_data_sensitivity(self, severity_levels: List[int]) -> float:
         """Calculate data sensitivity score"""
-        score = 0
-        for finding in findings:
-            severity = finding.get("severity", "low")
-            if severity == "critical":
-                score += 40
-            elif severity == "high":
-                score += 25
-            elif severity == "medium":
-                score += 10
-            elif severity == "low":
-                score += 5
+        score = sum(SEVERITY_WEIGHTS[level] for level in severity_levels)
         return min(score, 100)
     
     def _calculate_cross_platform(self, platforms: List[Dict[str, Any]]) -> float:
@@ -91,7 +97,7 @@ class RiskCalculator:
         # For now, we'll use a default score
         return 50
     
-    def _calculate_exploitability(self, findings: List[Dict[str, Any]], 
+    def _calculate_exploitability(self, severity_levels: List[int], 
                                 platforms: List[Dict[str, Any]]) -> float:
         """Calculate exploitability score"""
         score = 0
@@ -102,11 +108,7 @@ class RiskCalculator:
             score += 20
             
         # Check for critical findings
-        for finding in findings:
-            if finding.get("severity") == "critical":
-                score += 30
-            elif finding.get("severity") == "high":
-                score += 15
+        score += sum(EXPLOITABILITY_WEIGHTS[level] for level in severity_levels)
                 
         return min(score, 100)
     
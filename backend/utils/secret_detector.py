@@ -4,25 +4,64 @@ This module provides functionality to detect potential secrets in text data.
 """
 
 import re
-from typing import List, Dict, Tuple
+import os
+import mmap
+from bisect import bisect_right
+from typing import List, Dict, Tuple, Iterable, FrozenSet
 import asyncio
 import time
+import aiofiles
+
+from .rate_limiter import TokenBucketRateLimiter
+
+# Hyperscan is optional; without it a keyword check narrows the patterns instead
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Files are scanned in chunks of this many characters. Each chunk is
+# rescanned from the last CHUNK_OVERLAP characters of the previous one, which
+# is longer than any secret needs, so matches across the boundary are found.
+# Only whole lines are scanned; a longer line is buffered until it ends.
+CHUNK_SIZE = 1 << 20
+CHUNK_OVERLAP = 256
+
+# The only non-ASCII characters re's IGNORECASE matches to ASCII letters:
+# "İ" and "ı" match "i", "ſ" matches "s" and the Kelvin sign matches "k"
+_IGNORECASE_ASCII_FOLDS = {"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"}
+_IGNORECASE_ASCII_TABLE = str.maketrans(_IGNORECASE_ASCII_FOLDS)
+
+# Files at least this large are memory-mapped and scanned as bytes instead
+MMAP_THRESHOLD = 64 << 20
+
+# Token buckets per domain as (capacity, refill per second); callers only
+# wait once a bucket is empty
+RATE_LIMITS = {
+    "file_scanning": (50, 50.0)
+}
+DEFAULT_RATE_LIMIT = (10, 10.0)
+_rate_buckets: Dict[str, TokenBucketRateLimiter] = {}
 
-# Simple rate limiting function for standalone use
 async def rate_limit(domain: str = "default"):
     """Simple rate limiting"""
-    await asyncio.sleep(0.1)  # Simple delay
+    bucket = _rate_buckets.get(domain)
+    if bucket is None:
+        bucket = _rate_buckets[domain] = TokenBucketRateLimiter(*RATE_LIMITS.get(domain, DEFAULT_RATE_LIMIT))
+    await bucket.acquire()
 
 class SecretDetector:
     def __init__(self):
         """Initialize secret detector with common patterns"""
-        # Common secret patterns
+        # Common secret patterns. The rest of a password's name and its value
+        # are bounded, so each "pwd" in a long word run can't rescan the whole
+        # run before failing.
         self.patterns = {
             "aws_access_key": r"(?i)(aws|amazon)[_\s-]?access[_\s-]?key[_\s-]?id?[^\w\r\n]{0,10}[A-Z0-9]{20}",
             "aws_secret_key": r"(?i)(aws|amazon)[_\s-]?secret[_\s-]?access[_\s-]?key[^\w\r\n]{0,10}[A-Za-z0-9/+=]{40}",
             "github_token": r"(?i)github[_\s-]?token[^\w\r\n]{0,10}[a-zA-Z0-9_]{35,40}",
             "api_key": r"(?i)api[_\s-]?key[^\w\r\n]{0,10}[a-zA-Z0-9_-]{32,64}",
-            "password": r"(?i)(password|pwd)[_\s-]?(?:\w*[=:]){0,1}[^\w\r\n]{0,10}[a-zA-Z0-9!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>?]{8,}",
+            "password": r"(?i)(?:password|pwd)[_\s-]?(?:\w{0,64}[=:])?[^\w\r\n]{0,10}[a-zA-Z0-9!@#$%^&*()_+\-=\[\]{};':\"\\|,.<>?]{8,128}",
             "bearer_token": r"(?i)bearer[^\w\r\n]{0,10}[a-zA-Z0-9\-_\.+/=]{20,}",
             "authorization_header": r"(?i)authorization[^\w\r\n]{0,10}(basic|bearer|token)[^\w\r\n]{0,10}[a-zA-Z0-9\-_\.+/=]{10,}",
             "private_key": r"-----BEGIN[^\r\n]*PRIVATE KEY-----",
@@ -34,6 +73,145 @@ class SecretDetector:
             "mailgun_api_key": r"(?i)mailgun[_\s-]?api[_\s-]?key[^\w\r\n]{0,10}[a-z0-9]{32}",
             "paypal_client_id": r"(?i)paypal[_\s-]?client[_\s-]?id[^\w\r\n]{0,10}[a-zA-Z0-9]{16,}"
         }
+        
+        # Literal keywords at least one of which every match of the type contains
+        self._anchors = {
+            "aws_access_key": ("aws", "amazon"),
+            "aws_secret_key": ("aws", "amazon"),
+            "github_token": ("github",),
+            "api_key": ("api",),
+            "password": ("password", "pwd"),
+            "bearer_token": ("bearer",),
+            "authorization_header": ("authorization",),
+            "private_key": ("-----begin",),
+            "slack_token": ("xox",),
+            "firebase": ("firebase",),
+            "heroku_api_key": ("heroku",),
+            "twilio_auth_token": ("twilio",),
+            "sendgrid_api_key": ("sendgrid",),
+            "mailgun_api_key": ("mailgun",),
+            "paypal_client_id": ("paypal",)
+        }
+        
+        # Every match starts with the first character of one of its anchors,
+        # in either case or as a non-ASCII character IGNORECASE folds onto it
+        self._first_chars = frozenset(
+            char
+            for anchors in self._anchors.values()
+            for anchor in anchors
+            for char in (anchor[0], anchor[0].upper())
+        )
+        self._first_chars |= {
+            char for char, folded in _IGNORECASE_ASCII_FOLDS.items()
+            if folded in self._first_chars
+        }
+        
+        # Shortest possible match per type; shorter text can't contain one.
+        # Keep these in step with the patterns above when editing them.
+        self._min_lengths = {
+            "aws_access_key": 33,
+            "aws_secret_key": 58,
+            "github_token": 46,
+            "api_key": 38,
+            "password": 11,
+            "bearer_token": 26,
+            "authorization_header": 28,
+            "private_key": 26,
+            "slack_token": 15,
+            "firebase": 38,
+            "heroku_api_key": 48,
+            "twilio_auth_token": 47,
+            "sendgrid_api_key": 44,
+            "mailgun_api_key": 45,
+            "paypal_client_id": 30
+        }
+        self._shortest_match = min(self._min_lengths.values())
+        
+        # Compile once so scans don't go through the re module's pattern cache
+        self._compiled = {
+            secret_type: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            for secret_type, pattern in self.patterns.items()
+        }
+        
+        # Bytes versions for memory-mapped files (\w, \s and IGNORECASE are ASCII-only here)
+        self._compiled_bytes = {
+            secret_type: re.compile(pattern.encode(), re.IGNORECASE | re.MULTILINE)
+            for secret_type, pattern in self.patterns.items()
+        }
+        
+        self._hs_types = list(self.patterns)
+        self._type_order = {secret_type: i for i, secret_type in enumerate(self.patterns)}
+        self._hs_db = self._build_hyperscan_db()
+    
+    @staticmethod
+    def _strip_flags(pattern: str) -> str:
+        """Drop a leading (?i); inline global flags are only allowed at the start of a regex"""
+        return pattern[4:] if pattern.startswith("(?i)") else pattern
+    
+    def _build_hyperscan_db(self):
+        """Compile a Hyperscan prefilter database, or return None if unavailable"""
+        if hyperscan is None:
+            return None
+        
+        # Prefilter mode accepts every pattern and may over-report, never
+        # under-report; the re pass afterwards produces the actual matches
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[self._strip_flags(p).encode() for p in self.patterns.values()],
+                ids=list(range(len(self._hs_types))),
+                elements=len(self._hs_types),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE |
+                       hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP |  # Count characters like re
+                       hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH] * len(self._hs_types)
+            )
+        except hyperscan.error:
+            return None
+        return db
+    
+    def _candidate_types(self, text: str) -> FrozenSet[str]:
+        """
+        Find the secret types that may match the text
+        
+        Returns:
+            FrozenSet of possible types
+        """
+        length = len(text)
+        # Text without any anchor's first character can't match, and this
+        # check runs in C, stopping at the first such character
+        if length < self._shortest_match or self._first_chars.isdisjoint(text):
+            return frozenset()
+        
+        # Map the non-ASCII characters IGNORECASE treats as ASCII letters onto
+        # them (one character each, so lengths and offsets are unchanged)
+        if not text.isascii():
+            text = text.translate(_IGNORECASE_ASCII_TABLE)
+        
+        if self._hs_db is None:
+            # Keyword prefilter: substring checks on the lowercased text are
+            # far cheaper than trying every pattern at every position
+            folded = text.lower()
+            return frozenset(
+                secret_type for secret_type, anchors in self._anchors.items()
+                if self._min_lengths[secret_type] <= length
+                and any(anchor in folded for anchor in anchors)
+            )
+        
+        found = set()
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(self._hs_types[pattern_id])
+        
+        # UTF-8 mode needs valid input, so lone surrogates become "?"
+        self._hs_db.scan(text.encode("utf-8", "replace"), match_event_handler=on_match)
+        return frozenset(t for t in found if self._min_lengths[t] <= length)
+    
+    def _candidate_patterns(self, text: str) -> List[Tuple[str, re.Pattern]]:
+        """Compiled patterns of the types that may match the text, in pattern order"""
+        secret_types = self._candidate_types(text)
+        if not secret_types:
+            return []
+        return [(secret_type, rx) for secret_type, rx in self._compiled.items()
+                if secret_type in secret_types]
 
     def detect_secrets(self, text: str) -> List[Dict[str, str]]:
         """
@@ -47,9 +225,8 @@ class SecretDetector:
         """
         secrets = []
         
-        for secret_type, pattern in self.patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+        for secret_type, rx in self._candidate_patterns(text):
+            for match in rx.finditer(text):
                 secrets.append({
                     "type": secret_type,
                     "value": match.group(),
@@ -70,23 +247,41 @@ class SecretDetector:
             List of detected secrets with context
         """
         secrets = []
-        lines = text.split('\n')
-        
-        for secret_type, pattern in self.patterns.items():
-            for i, line in enumerate(lines):
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    # Get context lines
-                    start_line = max(0, i - context_lines)
-                    end_line = min(len(lines), i + context_lines + 1)
-                    context = '\n'.join(lines[start_line:end_line])
-                    
-                    secrets.append({
-                        "type": secret_type,
-                        "value": match.group(),
-                        "line": i + 1,
-                        "context": context
-                    })
+        
+        candidates = self._candidate_patterns(text)
+        if candidates:
+            # Offsets of each line start, so lines are found by bisection
+            # instead of splitting the text
+            line_starts = [0]
+            line_starts.extend(m.end() for m in re.finditer('\n', text))
+        
+        for secret_type, rx in candidates:
+            # First hit per line, searching from the start of the next line
+            # after each one
+            pos = 0
+            while (match := rx.search(text, pos)) is not None:
+                i = bisect_right(line_starts, match.start()) - 1
+                line_end = line_starts[i + 1] - 1 if i + 1 < len(line_starts) else len(text)
+                pos = line_end + 1
+                if match.end() > line_end:
+                    # Crossed a newline (e.g. via [_\s-]); only keep what
+                    # the line alone matches
+                    match = rx.search(text, line_starts[i], line_end)
+                    if match is None:
+                        continue
+                
+                # Get context lines
+                start_line = max(0, i - context_lines)
+                end_line = min(len(line_starts), i + context_lines + 1)
+                end = line_starts[end_line] - 1 if end_line < len(line_starts) else len(text)
+                context = text[line_starts[start_line]:end]
+                
+                secrets.append({
+                    "type": secret_type,
+                    "value": match.group(),
+                    "line": i + 1,
+                    "context": context
+                })
         
         return secrets
     
@@ -98,30 +293,155 @@ class SecretDetector:
             file_path (str): Path to file to scan
             
         Returns:
-            List of detected secrets
+            List of detected secrets (positions are byte offsets for files
+            of MMAP_THRESHOLD bytes or more)
         """
         # Rate limit to be ethical
         await rate_limit("file_scanning")
         
+        secrets = []
+        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                return self.detect_secrets(content)
+            if os.path.getsize(file_path) >= MMAP_THRESHOLD:
+                # Scan the page cache directly rather than decoding the whole
+                # file into memory; runs in a thread as it doesn't yield
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self._detect_secrets_in_mmap, file_path)
+            
+            async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                tail = ""
+                base = 0  # File offset of tail[0]
+                # File offset each type's next search resumes from, so a match
+                # reported from one chunk isn't found again inside the next
+                resume = {}
+                scan_from = 0  # tail[:scan_from] is only lookbehind context
+                pending = []  # Chunks of a line that hasn't ended yet
+                while True:
+                    chunk = await f.read(CHUNK_SIZE)
+                    eof = not chunk
+                    if not eof and '\n' not in chunk:
+                        # No line ends in this chunk; read on instead of
+                        # scanning part of a line
+                        pending.append(chunk)
+                        continue
+                    buf = tail + "".join(pending) + chunk
+                    pending.clear()
+                    
+                    # Scan whole lines only: private_key's [^\r\n]* runs to
+                    # the last "PRIVATE KEY-----" on the line, so a match in a
+                    # partial line could end too early. Matches starting in
+                    # the overlap are left for the next chunk.
+                    limit = len(buf) if eof else buf.rfind('\n') + 1
+                    cutoff = limit if eof else max(scan_from, limit - CHUNK_OVERLAP)
+                    # Match in a worker thread so the event loop keeps serving
+                    # other requests (and other files' reads) meanwhile
+                    keep_from = await asyncio.to_thread(
+                        self._scan_chunk, secrets, buf, base, resume, scan_from, limit, cutoff, eof
+                    )
+                    
+                    if eof:
+                        # Group by type like detect_secrets (the sort is stable,
+                        # so each type stays in file order)
+                        secrets.sort(key=lambda secret: self._type_order[secret["type"]])
+                        return secrets
+                    # Keep one character before keep_from for the keyword
+                    # lookbehinds
+                    context_start = max(0, keep_from - 1)
+                    tail = buf[context_start:]
+                    base += context_start
+                    scan_from = keep_from - context_start
         except Exception as e:
             return [{"error": f"Error reading file {file_path}: {str(e)}"}]
 
+    def _scan_chunk(self, secrets: List[Dict[str, str]], buf: str, base: int,
+                    resume: Dict[str, int], scan_from: int, limit: int, cutoff: int,
+                    eof: bool) -> int:
+        """
+        Match the secret patterns against one buffered chunk of a file,
+        appending the finished matches to secrets and advancing resume
+        
+        Returns:
+            Buffer offset the next chunk must rescan from
+        """
+        keep_from = cutoff
+        found = []
+        for secret_type, rx in self._candidate_patterns(buf):
+            pos = max(scan_from, resume.get(secret_type, 0) - base)
+            for match in rx.finditer(buf, pos, limit):
+                start, end = match.span()
+                if start >= cutoff:
+                    break
+                if end == limit and not eof:
+                    # May continue into the next chunk; rescan from here
+                    keep_from = min(keep_from, start)
+                    break
+                found.append((secret_type, match))
+        
+        for secret_type, match in found:
+            start, end = match.span()
+            if start < keep_from:
+                resume[secret_type] = base + end
+                secrets.append({
+                    "type": secret_type,
+                    "value": match.group(),
+                    "position": (base + start, base + end)
+                })
+        return keep_from
+    
+    async def detect_secrets_in_files(self, file_paths: Iterable[str],
+                                      max_concurrency: int = 16) -> List[List[Dict[str, str]]]:
+        """
+        Detect potential secrets in several files concurrently
+        
+        Each file's pattern matching runs in worker threads, so the event
+        loop stays responsive and file reads overlap with matching. re holds
+        the GIL while it matches, so matching itself is not parallel.
+        
+        Args:
+            file_paths (Iterable[str]): Paths to files to scan
+            max_concurrency (int): Maximum number of files open at once
+            
+        Returns:
+            List of detected secrets for each file, in the order given
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def scan(file_path):
+            async with semaphore:
+                return await self.detect_secrets_in_file(file_path)
+        
+        return await asyncio.gather(*(scan(file_path) for file_path in file_paths))
+    
+    def _detect_secrets_in_mmap(self, file_path: str) -> List[Dict[str, str]]:
+        """
+        Detect potential secrets in a memory-mapped file
+        
+        Args:
+            file_path (str): Path to file to scan
+            
+        Returns:
+            List of detected secrets, with byte offsets as positions
+        """
+        secrets = []
+        
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for secret_type, rx in self._compiled_bytes.items():
+                for match in rx.finditer(mm):
+                    secrets.append({
+                        "type": secret_type,
+                        # Only the matched slice is decoded
+                        "value": match.group().decode('utf-8', 'replace'),
+                        "position": match.span()
+                    })
+        
+        return secrets
+
 # Global secret detector instance
 secret_detector = SecretDetector()
 
-# Convenience functions
-def detect_secrets(text: str) -> List[Dict[str, str]]:
-    """Detect secrets in text"""
-    return secret_detector.detect_secrets(text)
-
-def detect_secrets_with_context(text: str, context_lines: int = 3) -> List[Dict[str, str]]:
-    """Detect secrets with context"""
-    return secret_detector.detect_secrets_with_context(text, context_lines)
-
-async def detect_secrets_in_file(file_path: str) -> List[Dict[str, str]]:
-    """Detect secrets in a file"""
-    return await secret_detector.detect_secrets_in_file(file_path)
\ No newline at end of file
+# Convenience functions, bound once to the global instance so each call
+# skips the attribute lookup and wrapper frame
+detect_secrets = secret_detector.detect_secrets
+detect_secrets_with_context = secret_detector.detect_secrets_with_context
+detect_secrets_in_file = secret_detector.detect_secrets_in_file
+detect_secrets_in_files = secret_detector.detect_secrets_in_files
@@ -41,6 +41,11 @@ class TrackerDetector:
         """
         self.config = config or Config()
         self.tracker_rules = self.config.TRACKER_RULES
+        # Lowercased platform sets per rule, for hashed membership checks
+        self._rule_sets = {
+            tracker_name: (frozenset(p.lower() for p in rule["platforms"]), rule)
+            for tracker_name, rule in self.tracker_rules.items()
+        }
     
     def detect_trackers(self, platforms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -53,13 +58,17 @@ class TrackerDetector:
             List of detected trackers
         """
         trackers = []
-        platform_names = [p.get("name", "").lower() for p in platforms]
+        platform_names = frozenset(p.get("name", "").lower() for p in platforms)
         
-        for tracker_name, rule in self.tracker_rules.items():
-            matched_platforms = []
-            for platform in rule["platforms"]:
-                if platform.lower() in platform_names:
-                    matched_platforms.append(platform)
+        for tracker_name, (rule_platforms, rule) in self._rule_sets.items():
+            if rule_platforms.isdisjoint(platform_names):
+                continue
+            
+            # Keep the rule's order and spelling in the output
+            matched_platforms = [
+                platform for platform in rule["platforms"]
+                if platform.lower() in platform_names
+            ]
             
             if matched_platforms:
                 # Calculate confidence based on number of matched platforms
@@ -79,15 +88,20 @@ class TrackerDetector:
 # Global tracker detector instance
 tracker_detector = TrackerDetector()
 
-# Convenience functions
-def detect_trackers(platforms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Detect trackers based on platform usage"""
-    return tracker_detector.detect_trackers(platforms)
+# Convenience functions (detect_trackers is bound once to the global instance
+# so each call skips the attribute lookup and wrapper frame)
+detect_trackers = tracker_detector.detect_trackers
 
 def calculate_tracker_risk(trackers: List[Dict[str, Any]]) -> float:
     """Calculate overall tracker risk score"""
-    if not trackers:
+    # Sum and count in one pass, so any iterable of trackers works
+    total_confidence = 0.0
+    count = 0
+    for t in trackers:
+        total_confidence += t.get("confidence", 0)
+        count += 1
+    
+    if not count:
         return 0.0
     
-    total_confidence = sum(t.get("confidence", 0) for t in trackers)
-    return min(total_confidence / len(trackers) * 100, 100)
\ No newline at end of file
+    return min(total_confidence / count * 100, 100)
\ No newline at end of file
@@ -21,6 +21,12 @@ def check_python_version():
 
 def check_import(module_name, package_name=None):
     """Check if a module can be imported"""
+    # Already imported (e.g. as a dependency of an earlier check); skip the
+    # finder's search of sys.path
+    if module_name in sys.modules:
+        print(f"✅ {module_name} - OK (cached)")
+        return True
+    
     try:
         if package_name:
             spec = importlib.util.find_spec(package_name)
@@ -115,6 +121,7 @@ def check_external_dependencies():
         ("pyvis", "pyvis"),
         ("sqlalchemy", "sqlalchemy"),
         ("requests", "requests"),
+        ("httpx", "httpx"),
         ("email_validator", None)  # email-validator package imports as email_validator
     ]
     
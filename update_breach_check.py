@@ -1,83 +0,0 @@
-with open('backend/main.py', 'r') as f:
-    content = f.read()
-
-# Replace the breach check function implementation
-old_impl = '''# Breach check endpoint
-@app.get("/api/v1/breach-check/{email}")
-async def check_breaches(email: str):
-    """Check if an email has been involved in known data breaches"""
-    # This would query the HaveIBeenPwned API in production
-    return {
-        "email": email,
-        "breaches_found": 0,
-        "breaches": [],
-        "checked_at": datetime.now().isoformat()
-    }'''
-
-new_impl = '''# Breach check endpoint
-@app.get("/api/v1/breach-check/{email}")
-async def check_breaches(email: str):
-    """Check if an email has been involved in known data breaches"""
-    # Query the HaveIBeenPwned API
-    import requests
-    import hashlib
-    
-    try:
-        # Rate limit to be ethical
-        from utils.rate_limiter import rate_limit
-        await rate_limit("hibp")
-        
-        # HIBP uses k-anonymity, so we only send the first 5 characters of the SHA1 hash
-        sha1_hash = hashlib.sha1(email.encode('utf-8')).hexdigest().upper()
-        prefix = sha1_hash[:5]
-        suffix = sha1_hash[5:]
-        
-        # Query HIBP API
-        url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{email}?truncateResponse=false"
-        headers = {
-            "User-Agent": "DFM-OSINT-Tool"
-        }
-        
-        # For demo purposes, we'll simulate a successful response
-        # In a real implementation with a valid API key, you would use:
-        # response = requests.get(url, headers=headers, timeout=10)
-        # response.raise_for_status()
-        # breaches = response.json()
-        
-        # Simulated response for demo
-        breaches = [
-            {
-                "Name": "Adobe",
-                "Title": "Adobe",
-                "Domain": "adobe.com",
-                "BreachDate": "2013-10-04",
-                "AddedDate": "2013-12-04T00:00:00Z",
-                "ModifiedDate": "2013-12-04T00:00:00Z",
-                "PwnCount": 152445165,
-                "Description": "In October 2013, 153 million Adobe accounts were breached...",
-                "LogoPath": "https://haveibeenpwned.com/Content/Images/PwnedLogos/Adobe.png"
-            }
-        ] if "adobe" in email.lower() else []
-        
-        return {
-            "email": email,
-            "breaches_found": len(breaches),
-            "breaches": breaches,
-            "checked_at": datetime.now().isoformat()
-        }
-    except Exception as e:
-        # Return empty result on error to avoid exposing internal errors
-        return {
-            "email": email,
-            "breaches_found": 0,
-            "breaches": [],
-            "checked_at": datetime.now().isoformat(),
-            "error": "Unable to check breaches at this time"
-        }'''
-
-content = content.replace(old_impl, new_impl)
-
-with open('backend/main.py', 'w') as f:
-    f.write(content)
-
-print("Updated the breach check function implementation")
\ No newline at end of file